@@ -133,22 +133,27 @@ class OFWProcessor:
             for p in sorted(participants):
                 f.write(f"- {p}\n")
         
-        # Create chronological message log
+        # Create chronological message log, streamed through a large buffer
+        # so memory stays bounded however many messages there are
         log_file = self.notebooklm_dir / f"{Path(pdf_name).stem}_messages.txt"
-        with open(log_file, 'w', encoding='utf-8') as f:
-            for i, msg in enumerate(messages, 1):
-                f.write(f"\nMessage {i}\n")
-                f.write("-" * 50 + "\n")
-                f.write(f"From: {msg['from']}\n")
-                f.write(f"To: {msg['to']}\n")
-                f.write(f"Sent: {msg['sent_time']}\n")
-                if msg.get('subject'):
-                    f.write(f"Subject: {msg['subject']}\n")
-                if msg.get('first_viewed'):
-                    f.write(f"First Viewed: {msg['first_viewed']}\n")
-                f.write("\nContent:\n")
-                f.write(msg['content'])
-                f.write("\n" + "=" * 50 + "\n")
+        with open(log_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.writelines(self._message_log_lines(messages))
+    
+    def _message_log_lines(self, messages):
+        """Yield the NotebookLM message log piece by piece."""
+        for i, msg in enumerate(messages, 1):
+            yield f"\nMessage {i}\n"
+            yield "-" * 50 + "\n"
+            yield f"From: {msg['from']}\n"
+            yield f"To: {msg['to']}\n"
+            yield f"Sent: {msg['sent_time']}\n"
+            if msg.get('subject'):
+                yield f"Subject: {msg['subject']}\n"
+            if msg.get('first_viewed'):
+                yield f"First Viewed: {msg['first_viewed']}\n"
+            yield "\nContent:\n"
+            yield msg['content']
+            yield "\n" + "=" * 50 + "\n"
     
     def _generate_llm_docs(self, pdf_name, messages):
         """Generate ChatGPT/Claude optimized documents."""
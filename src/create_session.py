@@ -10,18 +10,18 @@ def create_session():
     registry = CheckpointRegistry(base_dir)
     status = registry.get_current_status()
     
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    now = datetime.now()
+    timestamp = now.strftime('%Y%m%d_%H%M%S')
     session_file = base_dir / f'SESSION_PROMPT_{timestamp}.md'
     
     with open(session_file, 'w', encoding='utf-8') as f:
         # Header
-        f.write(f"# EvidenceAI Development Session - {datetime.now()}\n\n")
+        f.write(f"# EvidenceAI Development Session - {now}\n\n")
         
         # Previous Session Summary
         f.write("## Previous Session Summary\n")
-        checkpoints = registry.get_checkpoint_history()
-        if checkpoints:
-            latest = checkpoints[-1]
+        latest = registry.get_latest_checkpoint()
+        if latest:
             f.write(f"Last Stage: {latest['stage']}\n")
             f.write(f"Completion: {latest['timestamp']}\n")
             if 'status' in latest:
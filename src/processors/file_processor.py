@@ -19,29 +19,49 @@ class FileProcessor:
     def process_pdf(self, filepath):
         """Process a PDF file and extract metadata."""
         try:
-            file_stats = os.stat(filepath)
-            
             with open(filepath, 'rb') as pdf_file:
                 pdf = PyPDF2.PdfReader(pdf_file)
-                page_count = len(pdf.pages)
                 
                 # Read first page
                 first_page = pdf.pages[0].extract_text()
                 
-                metadata = {
-                    'filename': os.path.basename(filepath),
-                    'file_size': file_stats.st_size,
-                    'last_modified': datetime.fromtimestamp(file_stats.st_mtime).isoformat(),
-                    'page_count': page_count,
-                    'first_page_preview': first_page[:500] if first_page else None
-                }
-                
+                metadata = self._build_metadata(filepath, len(pdf.pages), first_page)
                 self.logger.info(f"Processed file: {metadata['filename']}")
                 return metadata
                 
         except Exception as e:
             self.logger.error(f"Error processing file {filepath}: {str(e)}")
             raise
+    
+    def process_pdf_with_text(self, filepath):
+        """Extract metadata and full text from a PDF in a single parse."""
+        try:
+            with open(filepath, 'rb') as pdf_file:
+                pdf = PyPDF2.PdfReader(pdf_file)
+                page_texts = [page.extract_text() for page in pdf.pages]
+                
+                metadata = self._build_metadata(
+                    filepath, len(page_texts), page_texts[0] if page_texts else None
+                )
+                text = "".join(page_text + "\n" for page_text in page_texts)
+                
+                self.logger.info(f"Processed file: {metadata['filename']}")
+                return metadata, text
+                
+        except Exception as e:
+            self.logger.error(f"Error processing file {filepath}: {str(e)}")
+            raise
+    
+    def _build_metadata(self, filepath, page_count, first_page):
+        """Build the metadata record for a PDF."""
+        file_stats = os.stat(filepath)
+        return {
+            'filename': os.path.basename(filepath),
+            'file_size': file_stats.st_size,
+            'last_modified': datetime.fromtimestamp(file_stats.st_mtime).isoformat(),
+            'page_count': page_count,
+            'first_page_preview': first_page[:500] if first_page else None
+        }
             
     def extract_text(self, pdf_path):
         """Extract text from PDF."""
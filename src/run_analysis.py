@@ -36,6 +36,29 @@ class AnalysisPipeline:
         self.input_dir.mkdir(exist_ok=True)
         self.output_dir.mkdir(exist_ok=True)
         self.checkpoint_dir.mkdir(exist_ok=True)
+        
+        # Latest checkpoint per stage as (mtime, path), kept current by _save_checkpoint
+        self._latest_by_stage = self._index_checkpoints()
+        # Parsed checkpoint per stage as (path, data); stages only read their inputs
+        self._loaded = {}
+
+    def _index_checkpoints(self):
+        """Find the most recent checkpoint of each stage"""
+        # One directory scan for all stages; checkpoints are named
+        # {stage}_{YYYYmmdd}_{HHMMSS}.json
+        index = {}
+        stages = set(self.STAGES)
+        with os.scandir(self.checkpoint_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith('.json') or not entry.is_file():
+                    continue
+                stage = entry.name.rsplit('_', 2)[0]
+                if stage not in stages:
+                    continue
+                mtime = entry.stat().st_mtime
+                if stage not in index or mtime > index[stage][0]:
+                    index[stage] = (mtime, Path(entry.path))
+        return index
 
     def find_last_checkpoint(self):
         """Find the most recent checkpoint"""
@@ -44,11 +67,10 @@ class AnalysisPipeline:
         latest_stage = None
         
         for stage in self.STAGES:
-            checkpoints = list(self.checkpoint_dir.glob(f"{stage}_*.json"))
-            if checkpoints:
-                checkpoint = max(checkpoints, key=lambda p: p.stat().st_mtime)
-                if checkpoint.stat().st_mtime > latest_time:
-                    latest_time = checkpoint.stat().st_mtime
+            if stage in self._latest_by_stage:
+                mtime, checkpoint = self._latest_by_stage[stage]
+                if mtime > latest_time:
+                    latest_time = mtime
                     latest_checkpoint = checkpoint
                     latest_stage = stage
                     
@@ -208,20 +230,27 @@ class AnalysisPipeline:
         
         with open(checkpoint_file, 'w') as f:
             json.dump(data, f, indent=2)
+        self._latest_by_stage[stage] = (checkpoint_file.stat().st_mtime, checkpoint_file)
+        self._loaded.pop(stage, None)
             
         self.logger.info(f"Saved checkpoint for stage {stage}: {checkpoint_file}")
 
     def load_checkpoint(self, stage):
         """Load most recent checkpoint for a stage"""
-        checkpoints = list(self.checkpoint_dir.glob(f"{stage}_*.json"))
-        
-        if not checkpoints:
+        if stage not in self._latest_by_stage:
             raise ValueError(f"No checkpoint found for stage: {stage}")
             
-        latest_checkpoint = max(checkpoints, key=lambda p: p.stat().st_mtime)
+        _, latest_checkpoint = self._latest_by_stage[stage]
         
+        # The final stage reloads every earlier stage; parse each file only once
+        cached = self._loaded.get(stage)
+        if cached and cached[0] == latest_checkpoint:
+            return cached[1]
+            
         with open(latest_checkpoint) as f:
-            return json.load(f)
+            data = json.load(f)
+        self._loaded[stage] = (latest_checkpoint, data)
+        return data
 
 if __name__ == "__main__":
     # Create and run pipeline
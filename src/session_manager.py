@@ -14,10 +14,12 @@ class SessionManager:
         
     def create_session(self) -> dict:
         """Create new session with current status"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # One clock read, so the session id, file name and created_at agree
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
         session = {
             'session_id': f'session_{timestamp}',
-            'created_at': datetime.now().isoformat(),
+            'created_at': now.isoformat(),
             'input_files': self._get_input_files(),
             'status': 'initialized',
             'progress': {
@@ -1,4 +1,5 @@
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 import json
 from datetime import datetime, timedelta
@@ -14,31 +15,41 @@ class TestNotebookLMGenerator:
 
     def setup_directories(self):
         """Ensure all required directories exist"""
-        for directory in [self.input_dir, self.output_dir, self.notebooklm_dir]:
-            directory.mkdir(parents=True, exist_ok=True)
-            
-        # Create subdirectories for different document types
-        for subdir in ['threads', 'topics', 'participants']:
-            (self.notebooklm_dir / subdir).mkdir(exist_ok=True)
+        directories = [self.input_dir, self.output_dir, self.notebooklm_dir]
+        
+        # Subdirectories for different document types
+        directories.extend(self.notebooklm_dir / subdir for subdir in ['threads', 'topics', 'participants'])
+        
+        # Parents sort ahead of children, so each mkdir is a single syscall;
+        # only a missing ancestor outside the list needs the parents=True walk
+        for directory in sorted(directories, key=lambda d: len(d.parts)):
+            try:
+                directory.mkdir(exist_ok=True)
+            except FileNotFoundError:
+                directory.mkdir(parents=True, exist_ok=True)
 
     def generate_test_documents(self):
         """Generate test NotebookLM documents"""
         self.setup_directories()
         
-        # Generate main documents
-        self._generate_overview()
-        self._generate_timeline()
-        self._generate_cross_references()
-        self._generate_index()
-        
-        # Generate thread documents
-        self._generate_thread_documents()
-        
-        # Generate topic documents
-        self._generate_topic_documents()
-        
-        # Generate participant documents
-        self._generate_participant_documents()
+        # Every document is an independent file, so the writes can overlap
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            # Generate main documents
+            futures = [executor.submit(generate) for generate in (
+                self._generate_overview,
+                self._generate_timeline,
+                self._generate_cross_references,
+                self._generate_index
+            )]
+            
+            # Generate thread, topic and participant documents
+            futures.extend(self._generate_thread_documents(executor))
+            futures.extend(self._generate_topic_documents(executor))
+            futures.extend(self._generate_participant_documents(executor))
+            
+            # Surface any write errors
+            for future in as_completed(futures):
+                future.result()
 
     def _generate_overview(self):
         """Generate overview document"""
@@ -97,8 +108,7 @@ class TestNotebookLMGenerator:
 3. Deep dive into specific [Threads](threads/) or [Topics](topics/)
 4. Analyze [Participant](participants/) communication patterns
 """
-        with open(self.notebooklm_dir / "00_Overview.md", 'w', encoding='utf-8') as f:
-            f.write(overview)
+        (self.notebooklm_dir / "00_Overview.md").write_bytes(overview.encode('utf-8'))
 
     def _generate_timeline(self):
         """Generate timeline document"""
@@ -157,8 +167,7 @@ class TestNotebookLMGenerator:
 - Review [Threads](threads/) for conversation details
 - Check [Topics](topics/) for subject analysis
 """
-        with open(self.notebooklm_dir / "timeline.md", 'w', encoding='utf-8') as f:
-            f.write(timeline)
+        (self.notebooklm_dir / "timeline.md").write_bytes(timeline.encode('utf-8'))
 
     def _generate_cross_references(self):
         """Generate cross-reference document"""
@@ -207,11 +216,10 @@ class TestNotebookLMGenerator:
    - Supporting documents
    - Reference materials
 """
-        with open(self.notebooklm_dir / "cross_references.md", 'w', encoding='utf-8') as f:
-            f.write(cross_refs)
+        (self.notebooklm_dir / "cross_references.md").write_bytes(cross_refs.encode('utf-8'))
 
-    def _generate_thread_documents(self):
-        """Generate sample thread documents"""
+    def _generate_thread_documents(self, executor):
+        """Submit sample thread documents for writing"""
         threads = {
             "schedule": {
                 "title": "Schedule Coordination",
@@ -230,8 +238,12 @@ class TestNotebookLMGenerator:
             }
         }
         
-        for thread_id, thread in threads.items():
-            content = f"""# Thread: {thread['title']}
+        return [executor.submit(self._write_thread, thread_id, thread)
+                for thread_id, thread in threads.items()]
+
+    def _write_thread(self, thread_id, thread):
+        """Write a single thread document"""
+        content = f"""# Thread: {thread['title']}
 
 ## Overview
 - Date Range: {thread['dates']}
@@ -248,11 +260,10 @@ class TestNotebookLMGenerator:
 - See [Timeline](../timeline.md)
 - Check [Cross References](../cross_references.md)
 """
-            with open(self.notebooklm_dir / "threads" / f"thread_{thread_id}.md", 'w', encoding='utf-8') as f:
-                f.write(content)
+        (self.notebooklm_dir / "threads" / f"thread_{thread_id}.md").write_bytes(content.encode('utf-8'))
 
-    def _generate_topic_documents(self):
-        """Generate sample topic documents"""
+    def _generate_topic_documents(self, executor):
+        """Submit sample topic documents for writing"""
         topics = {
             "scheduling": "Schedule Management",
             "finance": "Financial Planning",
@@ -260,8 +271,12 @@ class TestNotebookLMGenerator:
             "activities": "Children's Activities"
         }
         
-        for topic_id, title in topics.items():
-            content = f"""# Topic: {title}
+        return [executor.submit(self._write_topic, topic_id, title)
+                for topic_id, title in topics.items()]
+
+    def _write_topic(self, topic_id, title):
+        """Write a single topic document"""
+        content = f"""# Topic: {title}
 
 ## Overview
 - Primary Focus
@@ -279,15 +294,18 @@ class TestNotebookLMGenerator:
 - Reference participants
 - Include key terms
 """
-            with open(self.notebooklm_dir / "topics" / f"topic_{topic_id}.md", 'w', encoding='utf-8') as f:
-                f.write(content)
+        (self.notebooklm_dir / "topics" / f"topic_{topic_id}.md").write_bytes(content.encode('utf-8'))
 
-    def _generate_participant_documents(self):
-        """Generate sample participant documents"""
+    def _generate_participant_documents(self, executor):
+        """Submit sample participant documents for writing"""
         participants = ["parent1", "parent2"]
         
-        for participant in participants:
-            content = f"""# Participant: {participant}
+        return [executor.submit(self._write_participant, participant)
+                for participant in participants]
+
+    def _write_participant(self, participant):
+        """Write a single participant document"""
+        content = f"""# Participant: {participant}
 
 ## Communication Style
 - Response Patterns
@@ -304,8 +322,7 @@ class TestNotebookLMGenerator:
 - Topic Connections
 - Thread Participation
 """
-            with open(self.notebooklm_dir / "participants" / f"{participant}.md", 'w', encoding='utf-8') as f:
-                f.write(content)
+        (self.notebooklm_dir / "participants" / f"{participant}.md").write_bytes(content.encode('utf-8'))
 
     def _generate_index(self):
         """Generate index document"""
@@ -331,8 +348,7 @@ class TestNotebookLMGenerator:
 - Follow cross-references
 - Explore related documents
 """
-        with open(self.notebooklm_dir / "index.md", 'w', encoding='utf-8') as f:
-            f.write(index)
+        (self.notebooklm_dir / "index.md").write_bytes(index.encode('utf-8'))
 
 def main():
     generator = TestNotebookLMGenerator()
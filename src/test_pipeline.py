@@ -5,10 +5,29 @@ from datetime import datetime
 from pathlib import Path
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("evidenceai")
 
+def _json_default(obj):
+    """Serialize types the JSON encoders do not handle natively."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, set):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _dumps(obj) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, default=_json_default).encode('utf-8')
+
 def print_header():
     """Print colorful test header."""
     print("\033[95m==================================\033[0m")
@@ -27,34 +46,35 @@ def run_tests(base_dir):
     """Run pipeline tests."""
     from processors.file_processor import FileProcessor
     
+    input_dir = base_dir / "input"
+    output_dir = base_dir / "output"
+    
+    # One clock read per run keeps the results timestamp and filename consistent
+    run_ts = datetime.now()
+    
+    results = {
+        'timestamp': run_ts.isoformat(),
+        'status': 'success',
+        'files_processed': 0,
+        'errors': []
+    }
+    
     try:
         # Initialize processor
         processor = FileProcessor(base_dir)
         
-        # Process input files
-        input_dir = base_dir / "input"
-        output_dir = base_dir / "output"
-        
-        results = {
-            'timestamp': datetime.now().isoformat(),
-            'files_processed': 0,
-            'errors': []
-        }
-        
         # Process PDF files
         for pdf_file in input_dir.glob('*.pdf'):
             try:
                 logger.info(f"Processing {pdf_file.name}")
-                metadata = processor.process_pdf(pdf_file)
+                # Extract metadata and text in one pass
+                metadata, text = processor.process_pdf_with_text(pdf_file)
                 results['files_processed'] += 1
                 
-                # Extract text
-                text = processor.extract_text(pdf_file)
-                
                 # Save extracted text
                 text_file = output_dir / f"{pdf_file.stem}_text.txt"
-                with open(text_file, 'w', encoding='utf-8') as f:
-                    f.write(text)
+                with open(text_file, 'wb', buffering=1024 * 1024) as f:
+                    f.write(text.encode('utf-8'))
                 
             except Exception as e:
                 error = {
@@ -64,17 +84,24 @@ def run_tests(base_dir):
                 results['errors'].append(error)
                 logger.error(f"Error processing {pdf_file.name}: {str(e)}")
         
-        # Save test results
-        results_file = output_dir / f"test_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(results_file, 'w') as f:
-            json.dump(results, f, indent=2)
-            
-        print("\033[92m✔ Test run completed successfully!\033[0m")
-        return True
-        
     except Exception as e:
-        print(f"\033[91m✘ Test run failed: {str(e)}\033[0m")
+        results['status'] = 'error'
+        results['error'] = str(e)
+    
+    # Save test results once, whatever the outcome
+    try:
+        results_file = output_dir / f"test_results_{run_ts.strftime('%Y%m%d_%H%M%S')}.json"
+        results_file.write_bytes(_dumps(results))
+    except OSError as e:
+        results['status'] = 'error'
+        results['error'] = f"Could not save results: {str(e)}"
+    
+    if results['status'] == 'error':
+        print(f"\033[91m✘ Test run failed: {results['error']}\033[0m")
         return False
+    
+    print("\033[92m✔ Test run completed successfully!\033[0m")
+    return True
 
 def main():
     """Run main test sequence."""
@@ -1,29 +1,43 @@
 """Message threading and chain building module."""
 
-from dataclasses import dataclass, field, asdict
+from bisect import bisect_left, insort
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Tuple
 import re
 import json
+import sys
 
-@dataclass
+_RE_QUOTED = re.compile(r'On (.*?), (.*?) wrote:')
+_RE_RE_PREFIX = re.compile(r'^[Rr][Ee]:\s*')
+_RE_NONALNUM = re.compile(r'[^a-zA-Z0-9]')
+_TS_STRIP = str.maketrans('', '', ':-')
+
+# Slotted dataclasses need Python 3.10+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_SLOTS)
 class ThreadMetadata:
     """Thread metadata container."""
     thread_id: str
     start_time: datetime
     last_update: datetime
-    participants: Set[str] = field(default_factory=set)
+    participants: List[str] = field(default_factory=list)
     message_count: int = 0
     depth: int = 0
     subject: Optional[str] = None
 
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON serialization."""
-        data = asdict(self)
-        data['start_time'] = self.start_time.isoformat()
-        data['last_update'] = self.last_update.isoformat()
-        data['participants'] = list(self.participants)
-        return data
+        return {
+            'thread_id': self.thread_id,
+            'start_time': self.start_time.isoformat(),
+            'last_update': self.last_update.isoformat(),
+            'participants': list(self.participants),
+            'message_count': self.message_count,
+            'depth': self.depth,
+            'subject': self.subject
+        }
 
 class ThreadEncoder(json.JSONEncoder):
     """JSON encoder for thread data."""
@@ -43,30 +57,47 @@ class MessageThreader:
         self.threads = {}
         self.thread_metadata = {}
         self._message_map = {}
+        # Secondary indexes over _message_map for parent lookup
+        self._by_sender_ts: Dict[Tuple[str, str], str] = {}
+        # Each subject bucket holds (timestamp, msg_id) pairs kept in sorted order
+        self._by_clean_subject: Dict[str, List[Tuple[str, str]]] = {}
+        # Quoted reference date string -> ISO timestamp (None if unparseable)
+        self._date_cache: Dict[str, Optional[str]] = {}
     
     def process_messages(self, messages: List[Dict]) -> Dict[str, Dict]:
         """Process messages into threaded conversations."""
         try:
-            # First pass: Create message map
-            for msg in messages:
+            # Single pass in timestamp order: a parent always precedes its
+            # replies, so each message only needs to be matched against the
+            # messages indexed before it
+            intern = sys.intern
+            for msg in sorted(messages, key=lambda m: m.get('timestamp') or ''):
                 msg_id = self._generate_message_id(msg)
-                if msg_id:  # Only process valid messages
-                    self._message_map[msg_id] = msg
-            
-            # Second pass: Build thread relationships
-            for msg_id, msg in self._message_map.items():
+                if not msg_id or msg_id in self._message_map:
+                    continue  # Only process valid, unseen messages
+                
+                # Share one string object per participant name across messages
+                msg['from'] = intern(msg['from'])
+                if isinstance(msg.get('to'), str):
+                    msg['to'] = intern(msg['to'])
+                
                 parent_id = self._find_parent_message(msg)
                 if parent_id:
-                    if 'children' not in self._message_map[parent_id]:
-                        self._message_map[parent_id]['children'] = []
-                    self._message_map[parent_id]['children'].append(msg)
+                    parent = self._message_map[parent_id]
+                    parent.setdefault('children', []).append(msg)
                     msg['parent_id'] = parent_id
                 else:
                     # No parent - this is a thread root
                     thread_id = self._generate_thread_id(msg)
                     self.threads[thread_id] = msg
+                
+                self._message_map[msg_id] = msg
+                self._by_sender_ts[(msg['from'], msg['timestamp'])] = msg_id
+                clean_subject = self._clean_subject(msg.get('subject') or '')
+                insort(self._by_clean_subject.setdefault(clean_subject, []),
+                       (msg['timestamp'], msg_id))
             
-            # Third pass: Build metadata
+            # Second pass: Build metadata (needs complete trees for depth)
             self._build_thread_metadata()
             
             return self.threads
@@ -79,79 +110,106 @@ class MessageThreader:
         """Generate unique message identifier."""
         if not msg.get('timestamp') or not msg.get('from'):
             return None
-        timestamp = msg['timestamp'].replace(':', '').replace('-', '')
+        timestamp = msg['timestamp'].translate(_TS_STRIP)
         return f"{msg['from']}_{timestamp}"
     
     def _generate_thread_id(self, msg: Dict) -> str:
         """Generate unique thread identifier."""
         subject = msg.get('subject', '').strip()
-        clean_subject = re.sub(r'[^a-zA-Z0-9]', '', subject) if subject else 'no_subject'
-        timestamp = msg['timestamp'].replace(':', '').replace('-', '')
+        clean_subject = _RE_NONALNUM.sub('', subject) if subject else 'no_subject'
+        timestamp = msg['timestamp'].translate(_TS_STRIP)
         return f"thread_{clean_subject}_{timestamp}"
     
+    @staticmethod
+    def _clean_subject(subject: str) -> str:
+        """Strip any leading Re: prefix from a subject."""
+        return _RE_RE_PREFIX.sub('', subject).strip()
+    
+    def _parse_reference_date(self, date_str: str) -> Optional[str]:
+        """Convert a quoted reference date to ISO format, memoized per threader."""
+        try:
+            return self._date_cache[date_str]
+        except KeyError:
+            pass
+        try:
+            ref_iso = datetime.strptime(date_str, '%m/%d/%Y at %I:%M %p').isoformat()
+        except ValueError:
+            ref_iso = None
+        self._date_cache[date_str] = ref_iso
+        return ref_iso
+    
     def _find_parent_message(self, msg: Dict) -> Optional[str]:
         """Find parent message based on content and timing."""
-        # Look for quoted content references
-        quoted_pattern = r'On (.*?), (.*?) wrote:'
-        matches = re.findall(quoted_pattern, msg.get('content', ''))
+        # Look for quoted content references; most bodies quote nothing,
+        # so a substring test avoids running the regex at all
+        content = msg.get('content', '')
+        matches = _RE_QUOTED.findall(content) if 'wrote:' in content else ()
         
-        if matches:
-            # For each potential parent reference
-            for date_str, sender in matches:
-                try:
-                    # Convert reference date to datetime
-                    ref_date = datetime.strptime(date_str, '%m/%d/%Y at %I:%M %p')
-                    ref_iso = ref_date.isoformat()
-                    
-                    # Look for matching message
-                    for msg_id, candidate in self._message_map.items():
-                        if (candidate['from'] == sender and 
-                            candidate['timestamp'] == ref_iso and
-                            candidate['timestamp'] < msg['timestamp']):
-                            return msg_id
-                except ValueError:
-                    continue
-        
-        # Try subject matching if no quote found
-        if subject := msg.get('subject'):
-            # Remove Re: and clean subject
-            clean_subject = re.sub(r'^[Rr][Ee]:\s*', '', subject).strip()
-            potential_parents = [
-                (mid, m) for mid, m in self._message_map.items()
-                if (m['timestamp'] < msg['timestamp'] and
-                    re.sub(r'^[Rr][Ee]:\s*', '', m.get('subject', '')).strip() == clean_subject)
-            ]
+        # For each potential parent reference
+        for date_str, sender in matches:
+            ref_iso = self._parse_reference_date(date_str)
+            if ref_iso is None:
+                continue
             
-            if potential_parents:
-                # Get most recent matching subject
-                return max(potential_parents, key=lambda x: x[1]['timestamp'])[0]
+            # Look for matching message
+            msg_id = self._by_sender_ts.get((sender, ref_iso))
+            if msg_id and ref_iso < msg['timestamp']:
+                return msg_id
+        
+        # Try subject matching if no quote found; only replies (Re:) can
+        # have a parent by subject
+        subject = msg.get('subject')
+        if not subject or not subject.lower().startswith('re:'):
+            return None
+        
+        # Remove Re: and clean subject
+        clean_subject = self._clean_subject(subject)
+        bucket = self._by_clean_subject.get(clean_subject, ())
+        
+        # Most recent matching subject strictly before this message
+        idx = bisect_left(bucket, (msg['timestamp'],))
+        if idx:
+            return bucket[idx - 1][1]
         
         return None
     
     def _build_thread_metadata(self):
         """Build metadata for all threads."""
+        fromiso = datetime.fromisoformat
         for thread_id, root in self.threads.items():
-            start_time = datetime.fromisoformat(root['timestamp'])
+            start_time = fromiso(root['timestamp'])
             metadata = ThreadMetadata(
                 thread_id=thread_id,
                 start_time=start_time,
-                last_update=start_time,
-                participants={root['from'], root['to']}
+                last_update=start_time
             )
-            
-            def process_message(msg, depth=0):
-                metadata.message_count += 1
-                metadata.depth = max(metadata.depth, depth)
+
+            # Iterative DFS: avoids recursion limits on deep threads.
+            # Threads have a handful of participants, so a list with an
+            # ``in`` check is cheaper than a set.
+            participants = metadata.participants
+            message_count = 0
+            max_depth = 0
+            last_update = start_time
+            stack = [(root, 0)]
+            while stack:
+                msg, depth = stack.pop()
+                message_count += 1
+                if depth > max_depth:
+                    max_depth = depth
                 if msg.get('timestamp'):
-                    update_time = datetime.fromisoformat(msg['timestamp'])
-                    metadata.last_update = max(metadata.last_update, update_time)
-                metadata.participants.add(msg['from'])
-                metadata.participants.add(msg['to'])
-                
-                for child in msg.get('children', []):
-                    process_message(child, depth + 1)
-            
-            process_message(root)
+                    update_time = fromiso(msg['timestamp'])
+                    if update_time > last_update:
+                        last_update = update_time
+                for participant in (msg['from'], msg['to']):
+                    if participant not in participants:
+                        participants.append(participant)
+
+                stack.extend((child, depth + 1) for child in msg.get('children', ()))
+
+            metadata.message_count = message_count
+            metadata.depth = max_depth
+            metadata.last_update = last_update
             metadata.subject = root.get('subject')
             self.thread_metadata[thread_id] = metadata
     
@@ -164,20 +222,28 @@ class MessageThreader:
         if not self.thread_metadata:
             return {}
             
-        total_messages = sum(m.message_count for m in self.thread_metadata.values())
-        total_participants = len(set().union(
-            *[m.participants for m in self.thread_metadata.values()]
-        ))
+        # Single pass over the metadata for all totals and extremes
+        total_messages = 0
+        depth_sum = 0
+        all_participants = set()
+        start = end = None
+        for m in self.thread_metadata.values():
+            total_messages += m.message_count
+            depth_sum += m.depth
+            all_participants.update(m.participants)
+            if start is None or m.start_time < start:
+                start = m.start_time
+            if end is None or m.last_update > end:
+                end = m.last_update
         
-        metadata_list = list(self.thread_metadata.values())
         return {
             'total_threads': len(self.threads),
             'total_messages': total_messages,
-            'total_participants': total_participants,
-            'avg_thread_depth': sum(m.depth for m in metadata_list) / len(metadata_list),
+            'total_participants': len(all_participants),
+            'avg_thread_depth': depth_sum / len(self.thread_metadata),
             'avg_messages_per_thread': total_messages / len(self.threads),
             'time_span': {
-                'start': min(m.start_time for m in metadata_list).isoformat(),
-                'end': max(m.last_update for m in metadata_list).isoformat()
+                'start': start.isoformat(),
+                'end': end.isoformat()
             }
         }
\ No newline at end of file
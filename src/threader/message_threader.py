@@ -1,7 +1,49 @@
 from typing import Dict, List, Optional
+from calendar import monthrange
 from datetime import datetime
 import re
 from collections import defaultdict
+from functools import lru_cache
+from operator import itemgetter
+
+_RE_PREFIX = re.compile(r'^re:\s*')
+_QUOTED = re.compile(r'On [\d/]+ at [\d:]+ [AaPp][Mm], .+ wrote:')
+_PARENT_REF = re.compile(
+    r'On (?P<month>\d{1,2})/(?P<day>\d{1,2})/(?P<year>\d{4}) '
+    r'at (?P<hour>\d{1,2}):(?P<minute>\d{2}) (?P<meridiem>[AaPp])[Mm]'
+)
+
+def _reference_iso(ref) -> Optional[str]:
+    """
+    Builds the ISO timestamp for a _PARENT_REF match directly from its
+    groups, matching datetime(...).isoformat() for the same fields.
+    Returns None for out-of-range fields, as strptime would reject them.
+    """
+    year, month, day = int(ref['year']), int(ref['month']), int(ref['day'])
+    hour, minute = int(ref['hour']), int(ref['minute'])
+    if not (1 <= hour <= 12 and minute <= 59 and year >= 1 and 1 <= month <= 12
+            and 1 <= day <= monthrange(year, month)[1]):
+        return None
+    if ref['meridiem'] in 'Pp':
+        hour = hour % 12 + 12
+    else:
+        hour = hour % 12
+    return f"{year:04d}-{month:02d}-{day:02d}T{hour:02d}:{minute:02d}:00"
+
+@lru_cache(maxsize=8192)
+def _latest_parent_iso(content: str) -> Optional[str]:
+    """
+    Returns the ISO timestamp of the most recent message referenced in
+    content, or None. Fixed-width ISO strings sort chronologically, so
+    references are compared as strings. Memoized because replies often
+    quote the same text.
+    """
+    latest_parent_iso = None
+    for ref in _PARENT_REF.finditer(content):
+        ref_iso = _reference_iso(ref)
+        if ref_iso and (not latest_parent_iso or ref_iso > latest_parent_iso):
+            latest_parent_iso = ref_iso
+    return latest_parent_iso
 
 class MessageThreader:
     """Organizes parsed OFW messages into conversation threads"""
@@ -15,8 +57,13 @@ class MessageThreader:
         Takes parsed messages and organizes them into conversation threads.
         Returns thread structure with metadata.
         """
-        # Sort messages by timestamp
-        sorted_msgs = sorted(messages, key=lambda x: x['timestamp'] if x['timestamp'] else '0')
+        # Sort messages by timestamp; when every message has one, the C-level
+        # itemgetter key avoids a Python call per comparison key
+        get_timestamp = itemgetter('timestamp')
+        if all(map(get_timestamp, messages)):
+            sorted_msgs = sorted(messages, key=get_timestamp)
+        else:
+            sorted_msgs = sorted(messages, key=lambda x: x['timestamp'] if x['timestamp'] else '0')
         
         # First pass: Identify thread roots and build initial threads
         for msg in sorted_msgs:
@@ -28,17 +75,19 @@ class MessageThreader:
                 self.thread_metadata[thread_id] = {
                     'subject': msg.get('subject'),
                     'start_time': msg['timestamp'],
-                    'participants': set([msg['from'], msg['to']]),
+                    'participants': {msg['from']: None, msg['to']: None},
                     'message_count': 1,
                     'last_message_time': msg['timestamp']
                 }
             else:
+                # Participants are an insertion-ordered dict used as a set;
+                # messages arrive sorted, so the latest is always the current one
                 metadata = self.thread_metadata[thread_id]
-                metadata['participants'].add(msg['from'])
-                metadata['participants'].add(msg['to'])
+                participants = metadata['participants']
+                participants[msg['from']] = None
+                participants[msg['to']] = None
                 metadata['message_count'] += 1
-                if msg['timestamp'] > metadata['last_message_time']:
-                    metadata['last_message_time'] = msg['timestamp']
+                metadata['last_message_time'] = msg['timestamp']
         
         # Second pass: Build parent-child relationships
         for thread_id, thread_messages in self.threads.items():
@@ -54,21 +103,18 @@ class MessageThreader:
         """
         # Clean subject line
         subject = message.get('subject', '').lower()
-        subject = re.sub(r'^re:\s*', '', subject)
+        subject = _RE_PREFIX.sub('', subject)
         
         # Look for references to previous messages
         content = message.get('content', '')
-        quoted_pattern = r'On [\d/]+ at [\d:]+ [AaPp][Mm], .+ wrote:'
-        has_quotes = bool(re.search(quoted_pattern, content))
+        orig_msg_match = _QUOTED.search(content)
         
         # Generate thread ID (using subject + conversation markers)
         thread_components = [subject]
-        if has_quotes:
-            # Extract timestamp of original message if available
-            orig_msg_match = re.search(quoted_pattern, content)
-            if orig_msg_match:
-                thread_components.append(orig_msg_match.group(0))
-                
+        if orig_msg_match:
+            # Include the quoted original message marker
+            thread_components.append(orig_msg_match.group(0))
+            
         return '_'.join(thread_components)
     
     def _build_message_relationships(self, messages: List[Dict]) -> None:
@@ -76,38 +122,30 @@ class MessageThreader:
         Establishes parent-child relationships between messages in a thread.
         Modifies messages in place to add relationship links.
         """
+        by_timestamp = {}
         for i, msg in enumerate(messages):
             msg['thread_position'] = i
             msg['has_children'] = False
             
-            # Look for parent message references in content
-            content = msg.get('content', '')
-            parent_refs = re.finditer(r'On (\d{1,2}/\d{1,2}/\d{4} at \d{1,2}:\d{2} [AaPp][Mm])', content)
+            # Find most recent parent reference in content
+            parent_timestamp = _latest_parent_iso(msg.get('content', ''))
             
-            # Find most recent parent reference
-            latest_parent_time = None
-            for ref in parent_refs:
-                try:
-                    ref_time = datetime.strptime(ref.group(1), '%m/%d/%Y at %I:%M %p')
-                    if not latest_parent_time or ref_time > latest_parent_time:
-                        latest_parent_time = ref_time
-                except ValueError:
-                    continue
+            if parent_timestamp:
+                # Find parent message among the earlier messages
+                parent = by_timestamp.get(parent_timestamp)
+                if parent is not None:
+                    msg['parent_id'] = parent['index']
+                    parent['has_children'] = True
             
-            if latest_parent_time:
-                # Find parent message
-                parent_timestamp = latest_parent_time.isoformat()
-                for potential_parent in messages[:i]:  # Only look at earlier messages
-                    if potential_parent['timestamp'] == parent_timestamp:
-                        msg['parent_id'] = potential_parent['index']
-                        potential_parent['has_children'] = True
-                        break
+            # Index after lookup so a message never becomes its own parent;
+            # setdefault keeps the earliest message for a repeated timestamp
+            by_timestamp.setdefault(msg['timestamp'], msg)
     
     def _prepare_output(self) -> Dict:
         """
         Prepares final output structure with threads and metadata.
         """
-        # Convert metadata sets to lists for JSON serialization
+        # Convert participant dicts to lists for JSON serialization
         for metadata in self.thread_metadata.values():
             metadata['participants'] = list(metadata['participants'])
         
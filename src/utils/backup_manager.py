@@ -1,11 +1,29 @@
 import shutil
 import tarfile
+from contextlib import contextmanager
 from pathlib import Path
 import json
 from datetime import datetime
 import logging
 
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _loads(raw):
+    """Parse JSON bytes, using orjson when available."""
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
 class BackupManager:
+    # zstd compresses on all cores; fall back to gzip when it is not installed
+    ARCHIVE_SUFFIX = '.tar.zst' if zstandard is not None else '.tar.gz'
+    
     def __init__(self, base_dir=None):
         self.base_dir = Path(base_dir) if base_dir else Path(__file__).parent.parent.parent
         self.backup_dir = self.base_dir / 'backups'
@@ -52,13 +70,15 @@ class BackupManager:
             shutil.copytree(self.base_dir / 'logs', log_backup)
             manifest['contents'].append('logs')
             
-        # Save manifest
+        # Save manifest, plus a sidecar copy so listing never opens the archive
         with open(backup_path / 'manifest.json', 'w') as f:
             json.dump(manifest, f, indent=2)
+        shutil.copyfile(backup_path / 'manifest.json',
+                        self.backup_dir / f'backup_{timestamp}.manifest.json')
             
         # Create compressed archive
-        archive_name = f'backup_{timestamp}.tar.gz'
-        with tarfile.open(self.backup_dir / archive_name, 'w:gz') as tar:
+        archive_name = f'backup_{timestamp}{self.ARCHIVE_SUFFIX}'
+        with self._open_archive(self.backup_dir / archive_name, 'w') as tar:
             tar.add(backup_path, arcname=backup_path.name)
             
         # Clean up uncompressed backup
@@ -72,39 +92,41 @@ class BackupManager:
         if not backup_path.exists():
             raise FileNotFoundError(f'Backup not found: {backup_path}')
             
-        # Extract archive
-        temp_dir = self.backup_dir / 'temp_restore'
-        temp_dir.mkdir(exist_ok=True)
-        
-        with tarfile.open(backup_path, 'r:gz') as tar:
-            tar.extractall(temp_dir)
-            
-        # Read manifest
-        backup_contents = next(temp_dir.iterdir())
-        with open(backup_contents / 'manifest.json') as f:
-            manifest = json.load(f)
-            
-        # Restore contents
-        for content_type in manifest['contents']:
-            source = backup_contents / content_type
-            target = self.base_dir / content_type
-            
-            if target.exists():
-                shutil.rmtree(target)
-            shutil.copytree(source, target)
+        # Single streaming pass: each content directory in the archive (the
+        # manifest's contents) is cleared on first sight and written once
+        with self._open_archive(backup_path, 'r') as tar:
+            restored = set()
+            for member in tar:
+                parts = member.name.split('/', 2)
+                if len(parts) < 2 or parts[1] == 'manifest.json':
+                    continue
+                    
+                content_type = parts[1]
+                if content_type not in restored:
+                    target = self.base_dir / content_type
+                    if target.exists():
+                        shutil.rmtree(target)
+                    restored.add(content_type)
+                    
+                member.name = '/'.join(parts[1:])
+                tar.extract(member, self.base_dir)
             
-        # Clean up
-        shutil.rmtree(temp_dir)
         self.logger.info(f'Restored backup: {backup_path.name}')
 
     def list_backups(self):
         backups = []
-        for backup in self.backup_dir.glob('backup_*.tar.gz'):
+        for backup in self._archives(self.backup_dir, 'backup_*'):
             try:
-                with tarfile.open(backup, 'r:gz') as tar:
-                    manifest_info = tar.getmember(f"{backup.stem}/manifest.json")
-                    manifest_file = tar.extractfile(manifest_info)
-                    manifest = json.load(manifest_file)
+                sidecar = backup.with_name(f"{backup.name.split('.', 1)[0]}.manifest.json")
+                if sidecar.exists():
+                    manifest = _loads(sidecar.read_bytes())
+                else:
+                    # Legacy archive without a sidecar: scan it for the manifest
+                    with self._open_archive(backup, 'r') as tar:
+                        manifest = next(
+                            _loads(tar.extractfile(member).read()) for member in tar
+                            if member.name.endswith('/manifest.json')
+                        )
                     
                 backups.append({
                     'file': backup.name,
@@ -124,14 +146,46 @@ class BackupManager:
             
         # Create archive
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        archive_name = f'session_{session_dir.name}_{timestamp}.tar.gz'
+        archive_name = f'session_{session_dir.name}_{timestamp}{self.ARCHIVE_SUFFIX}'
         
-        with tarfile.open(self.archive_dir / archive_name, 'w:gz') as tar:
+        with self._open_archive(self.archive_dir / archive_name, 'w') as tar:
             tar.add(session_dir, arcname=session_dir.name)
             
         self.logger.info(f'Archived session: {archive_name}')
         return self.archive_dir / archive_name
 
+    @staticmethod
+    def _archives(directory, pattern):
+        """List gzip and zstd archives matching pattern"""
+        return [*directory.glob(f'{pattern}.tar.gz'), *directory.glob(f'{pattern}.tar.zst')]
+
+    @staticmethod
+    @contextmanager
+    def _open_archive(path, mode):
+        """Open a tar archive for streaming read ('r') or write ('w').
+        
+        Compression is chosen by suffix: .tar.zst uses multi-threaded zstd,
+        anything else gzip. Both are streamed, so members must be processed
+        in archive order.
+        """
+        path = Path(path)
+        if path.name.endswith('.tar.zst'):
+            if zstandard is None:
+                raise RuntimeError(f'zstandard is required to open {path.name}')
+            if mode == 'w':
+                cctx = zstandard.ZstdCompressor(level=3, threads=-1)
+                with open(path, 'wb') as f, cctx.stream_writer(f) as z, \
+                        tarfile.open(fileobj=z, mode='w|') as tar:
+                    yield tar
+            else:
+                dctx = zstandard.ZstdDecompressor()
+                with open(path, 'rb') as f, dctx.stream_reader(f) as z, \
+                        tarfile.open(fileobj=z, mode='r|') as tar:
+                    yield tar
+        else:
+            with tarfile.open(str(path), f'{mode}|gz') as tar:
+                yield tar
+
 def main():
     import argparse
     parser = argparse.ArgumentParser()
@@ -162,7 +216,7 @@ def main():
             print(f'Session archived: {archive_path}')
         else:
             print('\nArchived sessions:')
-            for archive in manager.archive_dir.glob('session_*.tar.gz'):
+            for archive in manager._archives(manager.archive_dir, 'session_*'):
                 print(f'- {archive.name}')
 
 if __name__ == '__main__':
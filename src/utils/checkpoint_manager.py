@@ -3,12 +3,18 @@ import time
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 class CheckpointManager:
     def __init__(self, session_dir: Path):
         self.session_dir = Path(session_dir)
         self.checkpoint_file = self.session_dir / "pipeline_checkpoint.json"
-        self.start_time = time.time()
-        self.max_duration = 3600  # 1 hour
+        # Budget math uses the monotonic clock in integer ns, immune to wall-clock jumps
+        self.start_ns = time.monotonic_ns()
+        self.max_ns = 3600 * 1_000_000_000  # 1 hour
         
     def save_checkpoint(self, stage: str, data: Dict[str, Any]) -> None:
         checkpoint = {
@@ -16,17 +22,23 @@ class CheckpointManager:
             'timestamp': time.time(),
             'data': data
         }
-        with open(self.checkpoint_file, 'w') as f:
-            json.dump(checkpoint, f)
+        if orjson is not None:
+            self.checkpoint_file.write_bytes(orjson.dumps(checkpoint, option=orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(self.checkpoint_file, 'w') as f:
+                json.dump(checkpoint, f, separators=(',', ':'))
             
     def load_checkpoint(self) -> Optional[Dict[str, Any]]:
         if self.checkpoint_file.exists():
-            with open(self.checkpoint_file) as f:
-                return json.load(f)
+            raw = self.checkpoint_file.read_bytes()
+            return orjson.loads(raw) if orjson is not None else json.loads(raw)
         return None
         
+    def time_remaining_ns(self) -> int:
+        return self.max_ns - (time.monotonic_ns() - self.start_ns)
+        
     def time_remaining(self) -> float:
-        return self.max_duration - (time.time() - self.start_time)
+        return self.time_remaining_ns() / 1_000_000_000
         
     def should_finalize(self) -> bool:
-        return self.time_remaining() < 300  # 5 minutes warning
\ No newline at end of file
+        return self.time_remaining_ns() < 300 * 1_000_000_000  # 5 minutes warning
\ No newline at end of file
@@ -1,29 +1,115 @@
 """Checkpoint registry to track processing state."""
 
+import copy
+from dataclasses import dataclass
 from datetime import datetime
+import atexit
 import json
 from pathlib import Path
 import os
+import time
+from typing import Optional
+import weakref
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+@dataclass
+class Checkpoint:
+    """One stage update; slotted, as the registry can hold many of them."""
+    __slots__ = ('timestamp', 'stage', 'status')
+    timestamp: str
+    stage: str
+    status: dict
+    
+    def to_dict(self) -> dict:
+        return {'timestamp': self.timestamp, 'stage': self.stage, 'status': self.status}
+
+def _default(obj):
+    if isinstance(obj, Checkpoint):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _dumps(obj) -> bytes:
+    """Serialize to compact JSON bytes, using orjson when available."""
+    if orjson is not None:
+        # orjson serializes dataclasses natively, Checkpoint included
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, separators=(',', ':'), default=_default).encode('utf-8')
+
+def _loads(raw: bytes):
+    """Parse JSON bytes, using orjson when available."""
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+# Registries still open; flushed by a single exit hook. Held weakly, so a
+# registry that goes out of scope is freed (and flushed) as usual.
+_open_registries = weakref.WeakSet()
+
+@atexit.register
+def _close_open_registries():
+    for registry in list(_open_registries):
+        registry.close()
 
 class CheckpointRegistry:
+    """Tracks pipeline state.
+    
+    The registry file holds only the current status and is rewritten on
+    save; every checkpoint is appended to the checkpoints.log JSONL file,
+    so an update writes O(1) bytes however long the history grows.
+    """
+    # Stage updates are batched: save at most every FLUSH_INTERVAL seconds
+    # or every FLUSH_EVERY checkpoints, and always at exit
+    FLUSH_INTERVAL = 2.0
+    FLUSH_EVERY = 50
+    
     def __init__(self, base_dir: Path):
         self.base_dir = Path(base_dir)
         self.registry_file = self.base_dir / 'checkpoint_registry.json'
+        self.checkpoint_log = self.base_dir / 'checkpoints.log'
+        # Checkpoints not yet appended to the log
+        self._pending = []
+        self._dirty = False
+        # Whether a real stage update (not a heartbeat) is still unsaved
+        self._changed = False
+        # Log handle stays open between flushes; opened on first append
+        self._log_fh = None
         self.registry = self._load_registry()
+        # last_update of the registry as this instance last read or wrote it
+        self._seen_update = self.registry['last_update']
+        # The registry is fsynced only when the stage changes
+        self._synced_stage = self.registry['current_stage']
+        self._migrate_inline_checkpoints()
+        # Most recent checkpoint, for spotting repeated (no-op) updates
+        latest = self.get_latest_checkpoint()
+        self._last = Checkpoint(**latest) if latest else None
+        self._last_flush = time.monotonic()
+        _open_registries.add(self)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
     
     def _load_registry(self) -> dict:
         """Load or create registry with defaults."""
         try:
             if self.registry_file.exists():
-                with open(self.registry_file) as f:
-                    return json.load(f)
+                return _loads(self.registry_file.read_bytes())
         except Exception as e:
             print(f"Warning: Could not load registry ({str(e)}), creating new one")
             
         return {
             'last_update': datetime.now().isoformat(),
             'current_stage': 'initialization',
-            'checkpoints': [],
             'pipeline_status': {
                 'messages_processed': 0,
                 'threads_identified': 0,
@@ -32,20 +118,94 @@ class CheckpointRegistry:
             }
         }
     
-    def update_stage(self, stage: str, status: dict):
-        """Update registry with new stage information."""
-        self.registry['last_update'] = datetime.now().isoformat()
-        self.registry['current_stage'] = stage
+    def _migrate_inline_checkpoints(self):
+        """
+        Move checkpoints kept inline by registries from before the log into
+        the log, rewriting the registry at once. Done eagerly so only the
+        first instance to open an old registry migrates it.
+        """
+        if 'checkpoints' not in self.registry:
+            return
+        self._pending.extend(Checkpoint(**cp) for cp in self.registry.pop('checkpoints'))
+        if self._append_checkpoints():
+            self._save_registry()
+    
+    def update_stage(self, stage: str, status: dict, timestamp: str = None):
+        """Update registry with new stage information.
         
-        checkpoint = {
-            'timestamp': datetime.now().isoformat(),
-            'stage': stage,
-            'status': status
-        }
-        self.registry['checkpoints'].append(checkpoint)
+        Callers that already hold the checkpoint time can pass it as an ISO
+        string; otherwise the clock is read once for the whole update.
+        An update repeating the previous stage and status only refreshes
+        last_update and is not logged as a new checkpoint.
+        """
+        timestamp = timestamp or datetime.now().isoformat()
+        self.registry['last_update'] = timestamp
+        self._dirty = True
+        
+        # A heartbeat repeating the last stage and status records nothing
+        # new; only last_update changes, and it goes out with a later flush
+        last = self._last
+        if last is not None and last.stage == stage and last.status == status:
+            if time.monotonic() - self._last_flush > self.FLUSH_INTERVAL:
+                self.flush()
+            return
+        
+        # Snapshot the status: checkpoints are serialized later, in batches,
+        # and a caller may reuse and mutate the same dict between updates
+        status = copy.deepcopy(status)
+        self.registry['current_stage'] = stage
+        self._changed = True
+        self._last = Checkpoint(timestamp, stage, status)
+        self._pending.append(self._last)
         
         self._update_pipeline_status(status)
-        self._save_registry()
+        if (time.monotonic() - self._last_flush > self.FLUSH_INTERVAL
+                or len(self._pending) >= self.FLUSH_EVERY):
+            self.flush()
+    
+    def flush(self):
+        """Write any pending stage updates to disk."""
+        if not self._dirty:
+            return
+        if not self._append_checkpoints():
+            return
+        # A registry holding only heartbeats must not overwrite state another
+        # instance saved since this one read it
+        if self._changed or not self._superseded():
+            self._save_registry()
+        self._dirty = False
+        self._last_flush = time.monotonic()
+    
+    def close(self):
+        """Flush pending updates and close the checkpoint log."""
+        self.flush()
+        if self._log_fh is not None:
+            self._log_fh.close()
+            self._log_fh = None
+        _open_registries.discard(self)
+    
+    def _superseded(self) -> bool:
+        """Whether another instance has saved the registry since this one read or wrote it."""
+        try:
+            on_disk = _loads(self.registry_file.read_bytes())
+        except (OSError, ValueError):
+            return False
+        return on_disk.get('last_update') != self._seen_update
+    
+    def _append_checkpoints(self) -> bool:
+        """Append pending checkpoints to the JSONL log."""
+        if not self._pending:
+            return True
+        try:
+            if self._log_fh is None:
+                self._log_fh = open(self.checkpoint_log, 'ab', buffering=65536)
+            self._log_fh.writelines(_dumps(checkpoint) + b'\n' for checkpoint in self._pending)
+            self._log_fh.flush()
+        except OSError as e:
+            print(f"Warning: Could not append checkpoints ({str(e)})")
+            return False
+        self._pending.clear()
+        return True
     
     def _update_pipeline_status(self, status: dict):
         """Update pipeline status metrics."""
@@ -60,25 +220,38 @@ class CheckpointRegistry:
             pipeline_status['last_issues'] = status['issues']
     
     def _save_registry(self):
-        """Save registry to file with backup."""
-        # Create backup of existing registry
+        """Save registry to file atomically, keeping the previous version as backup."""
+        # Keep the previous registry as .bak by hard-linking it; the rename
+        # below gives the registry a new inode, so the link keeps old contents
         if self.registry_file.exists():
             backup_file = self.registry_file.with_suffix('.json.bak')
             try:
-                with open(self.registry_file, 'r') as src, open(backup_file, 'w') as dst:
-                    dst.write(src.read())
-            except Exception as e:
+                if backup_file.exists():
+                    backup_file.unlink()
+                os.link(self.registry_file, backup_file)
+            except OSError as e:
                 print(f"Warning: Could not create backup ({str(e)})")
         
-        # Save new registry
+        # Write to a temp file and rename over the registry, so a failed
+        # write never leaves a truncated registry behind. Only stage
+        # transitions pay for an fsync; updates within a stage do not.
+        tmp_file = self.registry_file.with_suffix('.json.tmp')
+        stage = self.registry['current_stage']
         try:
-            with open(self.registry_file, 'w') as f:
-                json.dump(self.registry, f, indent=2)
+            with open(tmp_file, 'wb') as f:
+                # Compact output: the registry is only read back by the program
+                f.write(_dumps(self.registry))
+                if stage != self._synced_stage:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_file, self.registry_file)
+            self._synced_stage = stage
+            self._seen_update = self.registry['last_update']
+            self._changed = False
         except Exception as e:
             print(f"Error saving registry: {str(e)}")
-            if backup_file.exists():
-                print("Restoring from backup...")
-                backup_file.replace(self.registry_file)
+            if tmp_file.exists():
+                tmp_file.unlink()
     
     def get_current_status(self) -> dict:
         """Get current pipeline status."""
@@ -89,5 +262,38 @@ class CheckpointRegistry:
         }
     
     def get_checkpoint_history(self) -> list:
-        """Get list of all checkpoints."""
-        return self.registry['checkpoints']
\ No newline at end of file
+        """Get list of all checkpoints, read from the log."""
+        history = []
+        if self.checkpoint_log.exists():
+            with open(self.checkpoint_log, 'rb') as f:
+                for line in f:
+                    try:
+                        history.append(_loads(line))
+                    except ValueError:
+                        continue  # Skip a line torn by an interrupted append
+        history.extend(checkpoint.to_dict() for checkpoint in self._pending)
+        return history
+    
+    def get_latest_checkpoint(self) -> Optional[dict]:
+        """Get the most recent checkpoint, reading only the tail of the log."""
+        if self._pending:
+            return self._pending[-1].to_dict()
+        try:
+            with open(self.checkpoint_log, 'rb') as f:
+                pos = f.seek(0, os.SEEK_END)
+                tail = b''
+                while pos > 0:
+                    step = min(4096, pos)
+                    pos -= step
+                    f.seek(pos)
+                    tail = f.read(step) + tail
+                    lines = tail.splitlines()
+                    # The first line may be cut off by the block boundary
+                    for line in reversed(lines if pos == 0 else lines[1:]):
+                        try:
+                            return _loads(line)
+                        except ValueError:
+                            continue  # Skip a torn or blank line
+        except FileNotFoundError:
+            pass
+        return None
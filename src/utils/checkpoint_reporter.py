@@ -1,11 +1,80 @@
 import json
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, TextIO
 from collections import defaultdict
+from dataclasses import dataclass
 import sys
 from .checkpoint_manager import CheckpointManager
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+def _write_json_indented(out: TextIO, obj) -> None:
+    """Pretty-print JSON straight into the report, using orjson when available."""
+    if obj == {}:
+        out.write("{}")  # Common for checkpoints without metadata
+    elif orjson is not None:
+        out.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8'))
+    else:
+        json.dump(obj, out, indent=2)
+
+def _dumps_line(obj) -> bytes:
+    """Serialize one NDJSON line, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS) + b'\n'
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8') + b'\n'
+
+def _read_checkpoint_header(file: Path) -> Dict:
+    """Read a checkpoint's top-level stage and timestamp.
+    
+    With ijson the file is stream-parsed only as far as those two keys,
+    so a large checkpoint is never loaded whole.
+    """
+    if ijson is not None:
+        header = {}
+        try:
+            with open(file, 'rb') as f:
+                for key, value in ijson.kvitems(f, '', use_float=True):
+                    if key in ('stage', 'timestamp'):
+                        header[key] = value
+                        if len(header) == 2:
+                            break
+            return header
+        except ijson.JSONError:
+            pass  # Fall back to a full parse
+    raw = file.read_bytes()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+STAGES = ('setup', 'pdf_parsing', 'threading', 'analysis', 'final')
+
+@dataclass
+class StageReport:
+    """Checkpoint status and chain for one stage, collected once per report"""
+    stage: str
+    status: Dict
+    chain: List[Dict]
+    
+    @property
+    def started(self) -> bool:
+        return self.status['status'] != 'not_started'
+    
+    @property
+    def broken_links(self) -> List[int]:
+        """Positions in the chain whose previous_checkpoint link does not match"""
+        chain = self.chain
+        return [
+            i for i in range(1, len(chain))
+            if chain[i]['previous_checkpoint'] != chain[i-1]['checkpoint_id']
+        ]
+
 class CheckpointReporter:
     """Generates detailed reports about checkpoint status and history"""
     
@@ -14,209 +83,236 @@ class CheckpointReporter:
         self.checkpoint_manager = CheckpointManager(self.base_dir)
         self.output_dir = self.base_dir / "output" / "reports"
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        # Checkpoint manager results, memoized for one report generation
+        self._cache = {}
         
-    def generate_full_report(self) -> Path:
-        """Generate comprehensive checkpoint report"""
-        report_sections = []
+    def _cached(self, key, compute):
+        """Return a memoized checkpoint manager result"""
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
         
-        # Overall Status
-        report_sections.extend([
-            "# EvidenceAI Checkpoint Status Report",
-            f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            "",
-            "## Overall Status",
-            self._generate_overall_status(),
-            "",
-            "## Stage Details",
-            self._generate_stage_details(),
-            "",
-            "## Checkpoint Chain Analysis",
-            self._generate_chain_analysis(),
-            "",
-            "## Data Integrity Report",
-            self._generate_integrity_report(),
-            "",
-            "## Recommendations",
-            self._generate_recommendations()
-        ])
+    def _verify_all(self):
+        return self._cached('verify', self.checkpoint_manager.verify_all_checkpoints)
         
-        # Save report
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        report_file = self.output_dir / f"checkpoint_report_{timestamp}.md"
+    def _collect(self, stage: str) -> StageReport:
+        """Fetch a stage's status and checkpoint chain"""
+        return StageReport(
+            stage=stage,
+            status=self.checkpoint_manager.get_stage_status(stage),
+            chain=self.checkpoint_manager.get_chain_of_checkpoints(stage)
+        )
         
-        with open(report_file, 'w') as f:
-            f.write('\n'.join(report_sections))
-            
-        return report_file
+    def generate_full_report(self) -> Path:
+        """Generate comprehensive checkpoint report
         
-    def _generate_overall_status(self) -> str:
-        """Generate overall status section"""
-        valid_files, invalid_files = self.checkpoint_manager.verify_all_checkpoints()
+        A structured NDJSON copy (see generate_structured_report) is written
+        next to the Markdown file from the same collected stage data.
+        """
+        try:
+            now = datetime.now()
+            # Each stage is queried once; both reports read the same list
+            stages = [self._collect(stage) for stage in STAGES]
+            report_file = self._report_path(now, '.md')
+            self._write_full_report(report_file, now, stages)
+            self._write_structured_report(report_file.with_suffix('.ndjson'), stages)
+            return report_file
+        finally:
+            # Later reports must see fresh checkpoint state
+            self._cache.clear()
+            
+    def generate_structured_report(self) -> Path:
+        """Generate the report as NDJSON, one JSON event per line"""
+        try:
+            report_file = self._report_path(datetime.now(), '.ndjson')
+            self._write_structured_report(report_file, [self._collect(stage) for stage in STAGES])
+            return report_file
+        finally:
+            self._cache.clear()
+            
+    def _report_path(self, now: datetime, suffix: str) -> Path:
+        return self.output_dir / f"checkpoint_report_{now.strftime('%Y%m%d_%H%M%S')}{suffix}"
         
-        status_lines = [
-            f"- Total Checkpoints: {len(valid_files) + len(invalid_files)}",
-            f"- Valid Checkpoints: {len(valid_files)}",
-            f"- Invalid/Corrupted: {len(invalid_files)}",
-            "",
-            "### Stage Progress",
-        ]
+    def _report_events(self, stages: List[StageReport]) -> Iterator[Dict]:
+        """Yield the structured report events"""
+        valid_files, invalid_files = self._verify_all()
+        yield {
+            'section': 'overall',
+            'total': len(valid_files) + len(invalid_files),
+            'valid': len(valid_files),
+            'invalid': len(invalid_files)
+        }
+        for report in stages:
+            status = report.status
+            yield {
+                'section': 'stage',
+                'stage': report.stage,
+                'status': status['status'],
+                'last_updated': status.get('last_updated'),
+                'checkpoint_count': status.get('checkpoint_count', 0),
+                'chain_len': len(report.chain),
+                'chain_complete': status.get('chain_complete'),
+                'broken_links': report.broken_links
+            }
+        for file in invalid_files:
+            yield {'section': 'invalid_checkpoint', 'file': file.name}
+            
+    def _write_structured_report(self, report_file: Path, stages: List[StageReport]) -> None:
+        """Write the report events to report_file as NDJSON"""
+        with open(report_file, 'wb', buffering=1 << 16) as out:
+            for event in self._report_events(stages):
+                out.write(_dumps_line(event))
+                
+    def _write_full_report(self, report_file: Path, now: datetime, stages: List[StageReport]) -> None:
+        """Write the report sections straight to the report file"""
+        with open(report_file, 'w', buffering=1 << 16) as out:
+            # Overall Status
+            out.write("# EvidenceAI Checkpoint Status Report\n")
+            out.write(f"Generated: {now.strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+            out.write("## Overall Status\n")
+            self._generate_overall_status(out, stages)
+            out.write("\n## Stage Details\n")
+            self._generate_stage_details(out, stages)
+            out.write("\n## Checkpoint Chain Analysis\n")
+            self._generate_chain_analysis(out, stages)
+            out.write("\n## Data Integrity Report\n")
+            self._generate_integrity_report(out)
+            out.write("\n## Recommendations\n")
+            self._generate_recommendations(out, stages)
         
-        # Add stage progress
-        for stage in ['setup', 'pdf_parsing', 'threading', 'analysis', 'final']:
-            status = self.checkpoint_manager.get_stage_status(stage)
-            emoji = "✅" if status['status'] != 'not_started' else "⏳"
-            status_lines.append(f"- {emoji} {stage.upper()}: {status['status']}")
-            if status['status'] != 'not_started':
-                status_lines.append(f"  - Last Updated: {status['last_updated']}")
-                status_lines.append(f"  - Checkpoints: {status['checkpoint_count']}")
+    def _generate_overall_status(self, out: TextIO, stages: List[StageReport]) -> None:
+        """Write overall status section"""
+        valid_files, invalid_files = self._verify_all()
         
-        return '\n'.join(status_lines)
+        out.write(
+            f"- Total Checkpoints: {len(valid_files) + len(invalid_files)}\n"
+            f"- Valid Checkpoints: {len(valid_files)}\n"
+            f"- Invalid/Corrupted: {len(invalid_files)}\n"
+            "\n"
+            "### Stage Progress\n"
+        )
         
-    def _generate_stage_details(self) -> str:
-        """Generate detailed stage information"""
-        stage_lines = []
+        # Add stage progress
+        for report in stages:
+            status = report.status
+            emoji = "✅" if report.started else "⏳"
+            out.write(f"- {emoji} {report.stage.upper()}: {status['status']}\n")
+            if report.started:
+                out.write(f"  - Last Updated: {status['last_updated']}\n")
+                out.write(f"  - Checkpoints: {status['checkpoint_count']}\n")
         
-        for stage in ['setup', 'pdf_parsing', 'threading', 'analysis', 'final']:
-            stage_lines.extend([
-                f"### {stage.upper()}",
-                ""
-            ])
+    def _generate_stage_details(self, out: TextIO, stages: List[StageReport]) -> None:
+        """Write detailed stage information"""
+        for report in stages:
+            out.write(f"### {report.stage.upper()}\n\n")
             
-            status = self.checkpoint_manager.get_stage_status(stage)
-            if status['status'] == 'not_started':
-                stage_lines.append("Stage not started.")
+            if not report.started:
+                out.write("Stage not started.\n")
                 continue
                 
-            chain = self.checkpoint_manager.get_chain_of_checkpoints(stage)
+            status, chain = report.status, report.chain
             
             # Stage statistics
-            stage_lines.extend([
-                "#### Statistics",
-                f"- Total Checkpoints: {len(chain)}",
-                f"- Chain Complete: {'Yes' if status['chain_complete'] else 'No'}",
-                f"- Latest Update: {status['last_updated']}",
-                "",
-                "#### Checkpoint History"
-            ])
+            out.write(
+                "#### Statistics\n"
+                f"- Total Checkpoints: {len(chain)}\n"
+                f"- Chain Complete: {'Yes' if status['chain_complete'] else 'No'}\n"
+                f"- Latest Update: {status['last_updated']}\n"
+                "\n"
+                "#### Checkpoint History\n"
+            )
             
             # Add checkpoint history
             for cp in chain:
-                stage_lines.extend([
-                    f"- Checkpoint {cp['checkpoint_id']}:",
-                    f"  - Time: {cp['timestamp']}",
-                    f"  - Metadata: {json.dumps(cp['metadata'], indent=2)}"
-                ])
+                out.write(
+                    f"- Checkpoint {cp['checkpoint_id']}:\n"
+                    f"  - Time: {cp['timestamp']}\n"
+                    "  - Metadata: "
+                )
+                _write_json_indented(out, cp['metadata'])
+                out.write("\n")
             
-            stage_lines.append("")
+            out.write("\n")
         
-        return '\n'.join(stage_lines)
-        
-    def _generate_chain_analysis(self) -> str:
-        """Generate analysis of checkpoint chains"""
-        chain_lines = []
-        
-        for stage in ['setup', 'pdf_parsing', 'threading', 'analysis', 'final']:
-            chain = self.checkpoint_manager.get_chain_of_checkpoints(stage)
+    def _generate_chain_analysis(self, out: TextIO, stages: List[StageReport]) -> None:
+        """Write analysis of checkpoint chains"""
+        for report in stages:
+            chain = report.chain
             if not chain:
                 continue
                 
-            chain_lines.extend([
-                f"### {stage.upper()} Chain",
-                f"Chain Length: {len(chain)}",
-                ""
-            ])
+            out.write(f"### {report.stage.upper()} Chain\nChain Length: {len(chain)}\n\n")
             
             # Analyze chain integrity
-            broken_links = []
-            for i in range(1, len(chain)):
-                if chain[i]['previous_checkpoint'] != chain[i-1]['checkpoint_id']:
-                    broken_links.append(i)
+            broken_links = report.broken_links
             
             if broken_links:
-                chain_lines.append("⚠️ Chain Integrity Issues Detected:")
+                out.write("⚠️ Chain Integrity Issues Detected:\n")
                 for link in broken_links:
-                    chain_lines.append(f"- Break between checkpoints {link} and {link+1}")
+                    out.write(f"- Break between checkpoints {link} and {link+1}\n")
             else:
-                chain_lines.append("✅ Chain Integrity Verified")
+                out.write("✅ Chain Integrity Verified\n")
             
-            chain_lines.append("")
-            
-        return '\n'.join(chain_lines)
+            out.write("\n")
         
-    def _generate_integrity_report(self) -> str:
-        """Generate data integrity report"""
-        valid_files, invalid_files = self.checkpoint_manager.verify_all_checkpoints()
+    def _generate_integrity_report(self, out: TextIO) -> None:
+        """Write data integrity report"""
+        valid_files, invalid_files = self._verify_all()
         
-        integrity_lines = [
-            "### Checkpoint Verification Results",
-            f"- Valid Checkpoints: {len(valid_files)}",
-            f"- Invalid Checkpoints: {len(invalid_files)}",
-            ""
-        ]
+        out.write(
+            "### Checkpoint Verification Results\n"
+            f"- Valid Checkpoints: {len(valid_files)}\n"
+            f"- Invalid Checkpoints: {len(invalid_files)}\n"
+            "\n"
+        )
         
         if invalid_files:
-            integrity_lines.extend([
-                "### Invalid Checkpoints Detected:",
-                ""
-            ])
+            out.write("### Invalid Checkpoints Detected:\n\n")
             
             for file in invalid_files:
-                integrity_lines.append(f"- {file.name}")
+                out.write(f"- {file.name}\n")
                 try:
-                    with open(file) as f:
-                        data = json.load(f)
-                    integrity_lines.append(f"  - Stage: {data.get('stage', 'unknown')}")
-                    integrity_lines.append(f"  - Time: {data.get('timestamp', 'unknown')}")
+                    data = _read_checkpoint_header(file)
+                    out.write(
+                        f"  - Stage: {data.get('stage', 'unknown')}\n"
+                        f"  - Time: {data.get('timestamp', 'unknown')}\n"
+                    )
                 except:
-                    integrity_lines.append("  - Unable to read file")
-                    
-        return '\n'.join(integrity_lines)
-        
-    def _generate_recommendations(self) -> str:
-        """Generate recommendations based on checkpoint analysis"""
-        recommendations = []
+                    out.write("  - Unable to read file\n")
         
+    def _generate_recommendations(self, out: TextIO, stages: List[StageReport]) -> None:
+        """Write recommendations based on checkpoint analysis"""
         # Check stage progression
-        incomplete_stages = []
-        for stage in ['setup', 'pdf_parsing', 'threading', 'analysis', 'final']:
-            status = self.checkpoint_manager.get_stage_status(stage)
-            if status['status'] == 'not_started':
-                incomplete_stages.append(stage)
+        incomplete_stages = [report.stage for report in stages if not report.started]
                 
         if incomplete_stages:
-            recommendations.extend([
-                "### Stage Progression",
-                f"- Complete {', '.join(incomplete_stages)} stages",
-                ""
-            ])
+            out.write(
+                "### Stage Progression\n"
+                f"- Complete {', '.join(incomplete_stages)} stages\n"
+                "\n"
+            )
             
         # Check checkpoint frequency
-        for stage in ['setup', 'pdf_parsing', 'threading', 'analysis', 'final']:
-            chain = self.checkpoint_manager.get_chain_of_checkpoints(stage)
-            if len(chain) > 10:
-                recommendations.extend([
-                    f"### {stage.upper()} Checkpoints",
-                    "- Consider pruning old checkpoints to maintain performance",
-                    f"- Current count: {len(chain)}",
-                    ""
-                ])
+        for report in stages:
+            if len(report.chain) > 10:
+                out.write(
+                    f"### {report.stage.upper()} Checkpoints\n"
+                    "- Consider pruning old checkpoints to maintain performance\n"
+                    f"- Current count: {len(report.chain)}\n"
+                    "\n"
+                )
                 
         # Check chain integrity
-        broken_chains = []
-        for stage in ['setup', 'pdf_parsing', 'threading', 'analysis', 'final']:
-            status = self.checkpoint_manager.get_stage_status(stage)
-            if status['status'] != 'not_started' and not status['chain_complete']:
-                broken_chains.append(stage)
+        broken_chains = [
+            report.stage for report in stages
+            if report.started and not report.status['chain_complete']
+        ]
                 
         if broken_chains:
-            recommendations.extend([
-                "### Chain Integrity",
-                "- Repair broken checkpoint chains in stages:",
-                *[f"  - {stage}" for stage in broken_chains],
-                ""
-            ])
-            
-        return '\n'.join(recommendations)
+            out.write("### Chain Integrity\n- Repair broken checkpoint chains in stages:\n")
+            for stage in broken_chains:
+                out.write(f"  - {stage}\n")
+            out.write("\n")
 
 def main():
     """Generate checkpoint report from command line"""
@@ -1,10 +1,22 @@
+import os
+import re
 import sys
-import pkg_resources
+from datetime import datetime
+from importlib.metadata import version as package_version, PackageNotFoundError
 import logging
 import psutil
 from pathlib import Path
 import json
 
+def _release(version):
+    """Numeric release part of a version string, e.g. (1, 5) for '1.5.0rc1'."""
+    match = re.match(r'\d+(?:\.\d+)*', version)
+    release = [int(part) for part in match.group().split('.')] if match else []
+    # Trailing zeros don't change the version: 1.5 == 1.5.0
+    while release and release[-1] == 0:
+        release.pop()
+    return tuple(release)
+
 class SystemDiagnostics:
     def __init__(self, base_dir=None):
         self.base_dir = Path(base_dir) if base_dir else Path(__file__).parent.parent.parent
@@ -22,16 +34,19 @@ class SystemDiagnostics:
         self.logger = logging.getLogger(__name__)
 
     def check_system_resources(self):
+        # One snapshot each; every psutil call is a separate syscall
+        memory = psutil.virtual_memory()
+        disk = psutil.disk_usage(self.base_dir)
         return {
             'memory': {
-                'total': psutil.virtual_memory().total,
-                'available': psutil.virtual_memory().available,
-                'percent': psutil.virtual_memory().percent
+                'total': memory.total,
+                'available': memory.available,
+                'percent': memory.percent
             },
             'disk': {
-                'total': psutil.disk_usage(self.base_dir).total,
-                'free': psutil.disk_usage(self.base_dir).free,
-                'percent': psutil.disk_usage(self.base_dir).percent
+                'total': disk.total,
+                'free': disk.free,
+                'percent': disk.percent
             },
             'cpu_percent': psutil.cpu_percent()
         }
@@ -47,13 +62,13 @@ class SystemDiagnostics:
         
         for package, min_version in required.items():
             try:
-                version = pkg_resources.get_distribution(package).version
+                version = package_version(package)
                 status[package] = {
                     'installed': True,
                     'version': version,
-                    'meets_min': pkg_resources.parse_version(version) >= pkg_resources.parse_version(min_version)
+                    'meets_min': _release(version) >= _release(min_version)
                 }
-            except pkg_resources.DistributionNotFound:
+            except PackageNotFoundError:
                 pass
                 
         return status
@@ -91,11 +106,15 @@ class SystemDiagnostics:
         
         components = {}
         for file_path in required_files:
-            path = self.base_dir / file_path
+            # One stat per file instead of exists() plus two stat() calls
+            try:
+                stats = (self.base_dir / file_path).stat()
+            except FileNotFoundError:
+                stats = None
             components[file_path] = {
-                'exists': path.exists(),
-                'size': path.stat().st_size if path.exists() else None,
-                'modified': datetime.fromtimestamp(path.stat().st_mtime) if path.exists() else None
+                'exists': stats is not None,
+                'size': stats.st_size if stats else None,
+                'modified': datetime.fromtimestamp(stats.st_mtime) if stats else None
             }
         return components
 
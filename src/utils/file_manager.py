@@ -1,10 +1,21 @@
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+import fnmatch
+import os
+import re
 import shutil
+import tarfile
 from pathlib import Path
 import json
 import logging
 from datetime import datetime
 
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 class FileManager:
     def __init__(self, base_dir=None):
         self.base_dir = Path(base_dir) if base_dir else Path(__file__).parent.parent.parent
@@ -24,80 +35,174 @@ class FileManager:
         """Search for files matching pattern"""
         results = []
         
-        # Search input directory
-        for file in self.input_dir.rglob(pattern or '*'):
-            if file.is_file():
-                results.append({
-                    'path': file,
-                    'type': 'input',
-                    'size': file.stat().st_size,
-                    'modified': datetime.fromtimestamp(file.stat().st_mtime)
-                })
-                
-        # Search output directory
-        for file in self.output_dir.rglob(pattern or '*'):
-            if file.is_file():
+        # Compile the name pattern once; like fnmatch, case-insensitive on Windows
+        match = None
+        if pattern:
+            match = re.compile(fnmatch.translate(pattern), re.IGNORECASE if os.name == 'nt' else 0).match
+        
+        # Search input and output directories
+        for root, file_type in ((self.input_dir, 'input'), (self.output_dir, 'output')):
+            for entry in self._scan_files(root):
+                if match and not match(entry.name):
+                    continue
+                stats = entry.stat()
                 results.append({
-                    'path': file,
-                    'type': 'output',
-                    'size': file.stat().st_size,
-                    'modified': datetime.fromtimestamp(file.stat().st_mtime)
+                    'path': Path(entry.path),
+                    'type': file_type,
+                    'size': stats.st_size,
+                    'modified': datetime.fromtimestamp(stats.st_mtime)
                 })
                 
         return results
         
+    def _scan_files(self, directory):
+        """Recursively yield DirEntry objects for files under directory.
+        
+        DirEntry caches its stat result and answers is_dir/is_file from the
+        directory listing, so each file costs at most one stat call.
+        """
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        yield from self._scan_files(entry.path)
+                    elif entry.is_file():
+                        yield entry
+        except OSError:
+            return  # Missing or unreadable directory, as rglob skips them
+        
     def clean_directories(self, older_than=None):
         """Clean temporary and old files"""
-        cleaned = []
+        cutoff = datetime.now().timestamp() - (older_than * 86400) if older_than else None
         
-        # Clean temp files
-        for temp in self.output_dir.rglob('*.tmp'):
-            temp.unlink()
-            cleaned.append(str(temp))
+        # One walk finds temp files and, if specified, old files
+        temp_files, old_files = [], []
+        for entry in self._scan_files(self.output_dir):
+            if fnmatch.fnmatch(entry.name, '*.tmp'):
+                temp_files.append(entry.path)
+            elif cutoff is not None and entry.stat().st_mtime < cutoff:
+                old_files.append(entry.path)
+                
+        expired = temp_files + old_files
+        if not expired:
+            return []
             
-        # Clean old files if specified
-        if older_than:
-            cutoff = datetime.now().timestamp() - (older_than * 86400)
-            for old in self.output_dir.rglob('*'):
-                if old.is_file() and old.stat().st_mtime < cutoff:
-                    old.unlink()
-                    cleaned.append(str(old))
+        # Unlink by name relative to an open descriptor for each parent
+        # directory, so the kernel resolves the directory path once rather
+        # than once per file; platforms without dir_fd unlink by full path
+        dir_fds = {}
+        try:
+            names, fds = [], []
+            for path in expired:
+                parent, name = os.path.split(path)
+                if parent not in dir_fds:
+                    dir_fds[parent] = self._open_dir(parent)
+                fd = dir_fds[parent]
+                names.append(name if fd is not None else path)
+                fds.append(fd)
+                
+            # unlink releases the GIL, so worker threads overlap the disk latency
+            with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+                removed = executor.map(self._remove_file, expired, names, fds)
+                return [path for path in removed if path]
+        finally:
+            for fd in dir_fds.values():
+                if fd is not None:
+                    os.close(fd)
                     
-        return cleaned
+    @staticmethod
+    def _open_dir(directory):
+        """Open a directory descriptor for dir_fd calls, or None if unsupported"""
+        if os.unlink not in os.supports_dir_fd:
+            return None
+        try:
+            return os.open(directory, os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0))
+        except OSError:
+            return None
+            
+    @staticmethod
+    def _remove_file(path, name, dir_fd):
+        """Delete a file, returning its path or None if it was already gone"""
+        try:
+            os.unlink(name, dir_fd=dir_fd)
+        except FileNotFoundError:
+            return None
+        return path
         
     def get_file_details(self, filepath):
         """Get detailed file information"""
-        path = Path(filepath)
-        if not path.exists():
+        # Plain os calls: one stat, no Path object or repeated suffix parsing
+        path = os.path.normpath(filepath)
+        try:
+            stats = os.stat(path)
+        except (FileNotFoundError, NotADirectoryError):
             return None
             
-        stats = path.stat()
+        name = os.path.basename(path)
+        suffix = os.path.splitext(name)[1]
         return {
-            'name': path.name,
-            'path': str(path),
+            'name': name,
+            'path': path,
             'size': stats.st_size,
             'created': datetime.fromtimestamp(stats.st_ctime),
             'modified': datetime.fromtimestamp(stats.st_mtime),
-            'type': path.suffix,
-            'is_temp': path.suffix == '.tmp',
-            'directory': str(path.parent)
+            'type': suffix,
+            'is_temp': suffix == '.tmp',
+            'directory': os.path.dirname(path) or '.'
         }
         
-    def archive_files(self, files, archive_name=None):
-        """Archive specified files"""
+    def archive_files(self, files, archive_name=None, archive_format='copy'):
+        """Archive specified files
+        
+        archive_format 'copy' copies each file; 'hardlink' links them into
+        the archive without copying data (copying only across devices), so
+        the archive shares contents with the originals; 'tar.zst' streams
+        them into a single compressed bundle (gzip if zstandard is missing).
+        """
+        if archive_format not in ('copy', 'hardlink', 'tar.zst'):
+            raise ValueError(f'Unknown archive format: {archive_format}')
+            
         if not archive_name:
             archive_name = f"archive_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
             
         archive_dir = self.archive_dir / archive_name
         archive_dir.mkdir(parents=True)
         
+        if archive_format == 'tar.zst':
+            with self._open_bundle(archive_dir) as (bundle, tar):
+                for file in files:
+                    tar.add(file, arcname=Path(file).name)
+            return archive_dir, [str(bundle)]
+            
         archived = []
         for file in files:
             dest = archive_dir / Path(file).name
-            shutil.copy2(file, dest)
+            if archive_format == 'hardlink':
+                try:
+                    os.link(file, dest)
+                except OSError:
+                    shutil.copy2(file, dest)  # Cross-device or links unsupported
+            else:
+                shutil.copy2(file, dest)
             archived.append(str(dest))
             
         return archive_dir, archived
+        
+    @staticmethod
+    @contextmanager
+    def _open_bundle(archive_dir):
+        """Open a streaming tar bundle in archive_dir, zstd-compressed when available"""
+        if zstandard is None:
+            bundle = archive_dir / 'bundle.tar.gz'
+            with tarfile.open(str(bundle), 'w|gz') as tar:
+                yield bundle, tar
+            return
+            
+        bundle = archive_dir / 'bundle.tar.zst'
+        cctx = zstandard.ZstdCompressor(level=3, threads=-1)
+        with open(bundle, 'wb') as f, cctx.stream_writer(f) as z, \
+                tarfile.open(fileobj=z, mode='w|') as tar:
+            yield bundle, tar
 
 def main():
     parser = argparse.ArgumentParser()
@@ -1,10 +1,17 @@
 """Logging configuration for EvidenceAI pipeline."""
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from datetime import datetime
 
 def setup_logger(base_dir: Path):
-    """Configure logging with both file and console output."""
+    """Configure logging with both file and console output.
+    
+    Log calls only enqueue the record; a background listener thread does
+    the file and console writes, so logging never blocks on disk I/O.
+    """
     # Create logs directory
     log_dir = base_dir / "logs"
     log_dir.mkdir(exist_ok=True)
@@ -12,18 +19,30 @@ def setup_logger(base_dir: Path):
     # Create log file with timestamp
     log_file = log_dir / f"pipeline_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
     
+    # Output handlers run on the listener thread
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    file_handler = logging.FileHandler(log_file)
+    console_handler = logging.StreamHandler()  # Also print to console
+    for handler in (file_handler, console_handler):
+        handler.setFormatter(formatter)
+    
     # Configure logging
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file),
-            logging.StreamHandler()  # Also print to console
-        ]
-    )
+    log_queue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    # Only merge args into the message here; the output handlers format it
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
+    
+    # basicConfig is a no-op if logging was already configured
+    if queue_handler in logging.getLogger().handlers:
+        listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
+    else:
+        file_handler.close()
     
     logger = logging.getLogger("evidenceai")
     logger.info("Starting EvidenceAI Pipeline")
     logger.info(f"Log file: {log_file}")
     
-    return logger
\ No newline at end of file
+    return logger
@@ -0,0 +1,35 @@
+"""Parsing of the timestamps in OFW message exports."""
+
+from datetime import datetime
+import re
+
+# Format of the sent_time and first_viewed fields in OFW exports
+TIME_FORMAT = '%m/%d/%Y at %I:%M %p'
+
+# TIME_FORMAT as strptime matches it: whitespace in the format matches any
+# run of whitespace, fields take one or two digits (the day may also be
+# space-padded), case is ignored
+_OFW_TIMESTAMP = re.compile(
+    r'([0-9]{1,2})/([0-9]{1,2}| [1-9])/([0-9]{4})\s+at\s+([0-9]{1,2}):([0-9]{1,2})\s+([AP]M)',
+    re.IGNORECASE
+)
+
+def parse_ofw_timestamp(value: str) -> datetime:
+    """
+    Parse an OFW timestamp such as '01/02/2024 at 3:04 PM'.
+    
+    Accepts and rejects the same strings as datetime.strptime(value,
+    TIME_FORMAT), raising ValueError likewise, without interpreting the
+    format string on every call.
+    """
+    match = _OFW_TIMESTAMP.fullmatch(value)
+    if match is not None:
+        month, day, year, hour, minute, meridiem = match.groups()
+        hour = int(hour)
+        if 1 <= hour <= 12:
+            hour = hour % 12 + (12 if meridiem.upper() == 'PM' else 0)
+            try:
+                return datetime(int(year), int(month), int(day), hour, int(minute))
+            except ValueError:
+                pass
+    raise ValueError(f"time data {value!r} does not match format {TIME_FORMAT!r}")
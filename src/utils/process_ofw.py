@@ -11,14 +11,23 @@ This module handles:
 5. Final Report Generation
 """
 
+import io
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 import logging
 from typing import Dict, List, Optional
 import statistics
 from collections import defaultdict
+from .report_generators import prepare_messages
+from .report_io import atomic_open, atomic_write_text, ensure_dirs, write_json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 class OFWProcessor:
     """Main processor for OFW message analysis."""
@@ -27,15 +36,8 @@ class OFWProcessor:
         """Initialize processor with directory configuration."""
         self.base_dir = Path(base_dir) if base_dir else Path.cwd()
         
-        # Set up directory structure
-        self.input_dir = self.base_dir / "input"
-        self.output_dir = self.base_dir / "output"
-        self.notebooklm_dir = self.base_dir / "ab_tools_NotebookLM"
-        self.chatgpt_dir = self.base_dir / "ab_tools_ChatGPT"
-        
-        # Ensure directories exist
-        for dir_path in [self.input_dir, self.output_dir, self.notebooklm_dir, self.chatgpt_dir]:
-            dir_path.mkdir(exist_ok=True)
+        # Set up directory structure, shared with ReportGenerator
+        self.input_dir, self.output_dir, self.notebooklm_dir, self.chatgpt_dir = ensure_dirs(self.base_dir)
             
         # Set up logging
         self.logger = self._setup_logging()
@@ -89,15 +91,19 @@ class OFWProcessor:
             # Generate all reports
             self.logger.info("Generating reports...")
             
-            success = all([
-                self._generate_timeline_report(),
-                self._generate_patterns_report(),
-                self._generate_participant_report(),
-                self._generate_statistics_report(),
-                self._generate_final_report(),
-                self._generate_notebooklm_format(),
-                self._generate_llm_format()
-            ])
+            # Each report is an independent file whose generator catches its
+            # own errors, so the writes can overlap
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futures = [executor.submit(generate) for generate in (
+                    self._generate_timeline_report,
+                    self._generate_patterns_report,
+                    self._generate_participant_report,
+                    self._generate_statistics_report,
+                    self._generate_final_report,
+                    self._generate_notebooklm_format,
+                    self._generate_llm_format
+                )]
+                success = all([future.result() for future in futures])
             
             if success:
                 self.logger.info("All reports generated successfully!")
@@ -119,10 +125,16 @@ class OFWProcessor:
                 self.logger.error(f"Messages file not found: {messages_file}")
                 return False
                 
-            with open(messages_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            raw = messages_file.read_bytes()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
                 
             self.messages = data['messages']
+            
+            # Parse timestamps and normalize subjects once, sorting messages
+            # chronologically. This is the same preparation ReportGenerator
+            # does, so it skips these messages when handed them.
+            prepare_messages(self.messages)
+                
             self.logger.info(f"Loaded {len(self.messages)} messages")
             return True
             
@@ -152,8 +164,7 @@ class OFWProcessor:
         # Group messages by day
         days = {}
         for msg in self.messages:
-            sent_time = datetime.strptime(msg['sent_time'], '%m/%d/%Y at %I:%M %p')
-            date_key = sent_time.strftime('%Y-%m-%d')
+            date_key = msg['_sent_date']
             
             if date_key not in days:
                 days[date_key] = []
@@ -189,7 +200,7 @@ class OFWProcessor:
         }
         
         # Process each message
-        for msg in sorted(self.messages, key=lambda x: datetime.strptime(x['sent_time'], '%m/%d/%Y at %I:%M %p')):
+        for msg in self.messages:
             # Update participant stats
             self._update_participant_stats(patterns, msg)
             
@@ -251,14 +262,24 @@ class OFWProcessor:
         
         return stats
         
+    @staticmethod
+    def _render(writer, *args) -> str:
+        """Run a _write_* report writer against an in-memory buffer.
+        
+        The writers make many small writes; collecting them in a StringIO
+        lets each report reach disk in a single write call.
+        """
+        buffer = io.StringIO()
+        writer(buffer, *args)
+        return buffer.getvalue()
+        
     def _generate_timeline_report(self) -> bool:
         """Generate timeline analysis report."""
         try:
             output_file = self.output_dir / 'timeline_analysis.txt'
             
-            with open(output_file, 'w', encoding='utf-8') as f:
-                # Write report
-                self._write_timeline_report(f, self.timeline)
+            # Write report
+            atomic_write_text(output_file, self._render(self._write_timeline_report, self.timeline))
                 
             return True
         except Exception as e:
@@ -270,8 +291,7 @@ class OFWProcessor:
         try:
             output_file = self.output_dir / 'communication_patterns.json'
             
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(self.patterns, f, indent=2)
+            write_json(output_file, self.patterns)
                 
             return True
         except Exception as e:
@@ -283,8 +303,7 @@ class OFWProcessor:
         try:
             output_file = self.output_dir / 'participant_summary.json'
             
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(self.participants, f, indent=2)
+            write_json(output_file, self.participants)
                 
             return True
         except Exception as e:
@@ -296,8 +315,7 @@ class OFWProcessor:
         try:
             output_file = self.output_dir / 'statistical_summary.json'
             
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(self.stats, f, indent=2)
+            write_json(output_file, self.stats)
                 
             return True
         except Exception as e:
@@ -308,9 +326,7 @@ class OFWProcessor:
         """Generate comprehensive final report."""
         try:
             output_file = self.output_dir / 'final_report.txt'
-            
-            with open(output_file, 'w', encoding='utf-8') as f:
-                self._write_final_report(f)
+            atomic_write_text(output_file, self._render(self._write_final_report))
                 
             return True
         except Exception as e:
@@ -322,12 +338,13 @@ class OFWProcessor:
         try:
             # Generate main analysis document
             main_file = self.notebooklm_dir / 'OFW_Messages_Analysis.txt'
-            with open(main_file, 'w', encoding='utf-8') as f:
-                self._write_notebooklm_analysis(f)
+            atomic_write_text(main_file, self._render(self._write_notebooklm_analysis))
             
-            # Generate chronological message log
+            # Generate chronological message log; it grows with the message
+            # count, so stream it through a large buffer instead of rendering
+            # it in memory
             log_file = self.notebooklm_dir / 'OFW_Messages_Log.txt'
-            with open(log_file, 'w', encoding='utf-8') as f:
+            with atomic_open(log_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
                 self._write_notebooklm_log(f)
                 
             return True
@@ -340,8 +357,7 @@ class OFWProcessor:
         try:
             # Generate main analysis document
             analysis_file = self.chatgpt_dir / 'OFW_Analysis.txt'
-            with open(analysis_file, 'w', encoding='utf-8') as f:
-                self._write_llm_analysis(f)
+            atomic_write_text(analysis_file, self._render(self._write_llm_analysis))
                 
             return True
         except Exception as e:
@@ -4,14 +4,86 @@ Report Generation Methods
 Handles generation of all analysis reports for OFW messages.
 """
 
-import json
+import math
 import os
 from datetime import datetime
 from pathlib import Path
 import logging
 from typing import Dict, List, Optional
 import statistics
+import sys
 from collections import defaultdict
+from operator import itemgetter
+from .ofw_time import TIME_FORMAT, parse_ofw_timestamp
+from .report_io import atomic_write_text, ensure_dirs, write_json
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+def _to_datetimes(values: List[Optional[str]]) -> List[Optional[datetime]]:
+    """Parse OFW timestamps, giving None for missing or 'Never' values.
+    
+    With pandas the whole column is parsed in one vectorized call
+    instead of one parse per message.
+    """
+    present = [bool(v) and v != 'Never' for v in values]
+    if pd is None:
+        return [parse_ofw_timestamp(v) if ok else None for v, ok in zip(values, present)]
+    column = pd.Series(values, dtype=object).where(present)
+    parsed = pd.DatetimeIndex(pd.to_datetime(column, format=TIME_FORMAT, cache=True))
+    return [dt if ok else None for dt, ok in zip(parsed.to_pydatetime(), present)]
+
+def _topic(subject: Optional[str]) -> str:
+    """Subject with any leading 'Re: ' reply prefixes removed."""
+    topic = subject or ''
+    while topic.startswith('Re: '):
+        topic = topic[4:]
+    return topic
+
+def prepare_messages(messages: List[Dict]) -> None:
+    """Derive each message's parsed fields once and sort messages chronologically.
+    
+    Adds _sent_dt, _sent_hour, _sent_date, _viewed_dt (None when the
+    message was never viewed) and _topic (the subject without reply
+    prefixes); already-prepared messages are skipped. The list is sorted
+    in place by _sent_dt, so every report can rely on its order instead
+    of sorting again.
+    """
+    pending = [msg for msg in messages if '_sent_dt' not in msg]
+    if pending:
+        sent_times = _to_datetimes([msg['sent_time'] for msg in pending])
+        viewed_times = _to_datetimes([msg.get('first_viewed') for msg in pending])
+        for msg, sent, viewed in zip(pending, sent_times, viewed_times):
+            msg['_sent_dt'] = sent
+            msg['_sent_hour'] = sent.hour
+            msg['_sent_date'] = sent.strftime('%Y-%m-%d')
+            msg['_viewed_dt'] = viewed
+            msg['_topic'] = sys.intern(_topic(msg.get('subject')))
+            # Interned names share one str object per participant, so the
+            # many dict lookups keyed by them compare by identity
+            msg['from'] = sys.intern(msg['from'])
+            msg['to'] = sys.intern(msg['to'])
+    messages.sort(key=itemgetter('_sent_dt'))
+
+# Column order for vectorized response statistics
+RESPONSE_AGGREGATES = ['mean', 'median', 'min', 'max', 'std', 'count']
+
+def _response_stats_row(mean, median, low, high, std, count) -> Dict:
+    """Shape one row of RESPONSE_AGGREGATES like _calculate_response_stats."""
+    return {
+        'average': mean,
+        'median': median,
+        'min': low,
+        'max': high,
+        'std_dev': std if count > 1 else 0
+    }
 
 class ReportGenerator:
     """Main report generation class."""
@@ -19,18 +91,15 @@ class ReportGenerator:
     def __init__(self, base_dir: str = None):
         """Initialize generator with directory structure."""
         self.base_dir = Path(base_dir) if base_dir else Path.cwd()
-        self.input_dir = self.base_dir / "input"
-        self.output_dir = self.base_dir / "output"
-        self.notebooklm_dir = self.base_dir / "ab_tools_NotebookLM"
-        self.chatgpt_dir = self.base_dir / "ab_tools_ChatGPT"
         
         # Ensure directories exist
-        for dir_path in [self.input_dir, self.output_dir, self.notebooklm_dir, self.chatgpt_dir]:
-            dir_path.mkdir(exist_ok=True)
+        self.input_dir, self.output_dir, self.notebooklm_dir, self.chatgpt_dir = ensure_dirs(self.base_dir)
             
     def generate_reports(self, messages: List[Dict]) -> bool:
         """Generate all required reports."""
         try:
+            prepare_messages(messages)
+            
             # Generate each report type
             timeline_ok = self.generate_timeline(messages)
             patterns_ok = self.generate_patterns(messages)
@@ -50,66 +119,69 @@ class ReportGenerator:
         output_file = self.output_dir / "timeline_analysis.txt"
         
         try:
-            # Group messages by day
+            prepare_messages(messages)
+            
+            # One pass groups messages by day and counts topics overall and per day
             days = defaultdict(list)
+            day_participants = defaultdict(set)
+            day_topic_counts = defaultdict(lambda: defaultdict(int))
+            topics = defaultdict(int)
             for msg in messages:
-                sent_time = datetime.strptime(msg['sent_time'], '%m/%d/%Y at %I:%M %p')
-                days[sent_time.strftime('%Y-%m-%d')].append(msg)
-            
-            # Generate report
-            with open(output_file, 'w', encoding='utf-8') as f:
-                # Header
-                f.write("OFW COMMUNICATIONS TIMELINE ANALYSIS\n")
-                f.write("===================================\n\n")
-                
-                # Overview
-                f.write("OVERVIEW\n")
-                f.write("--------\n")
-                f.write(f"Total Messages: {len(messages)}\n")
-                f.write(f"Date Range: {messages[0]['sent_time']} to {messages[-1]['sent_time']}\n")
-                f.write(f"Active Days: {len(days)}\n")
-                f.write("\nKey Topics:\n")
-                
-                # Identify key topics
-                topics = defaultdict(int)
-                for msg in messages:
-                    if msg.get('subject'):
-                        topics[msg['subject'].replace('Re: ', '')] += 1
+                date = msg['_sent_date']
+                days[date].append(msg)
+                day_participants[date].update((msg['from'], msg['to']))
+                if msg.get('subject'):
+                    topic = msg['_topic']
+                    topics[topic] += 1
+                    day_topic_counts[date][topic] += 1
+            
+            # Build the report in memory and write it with a single call
+            parts = []
+            append = parts.append
+            
+            # Header
+            append("OFW COMMUNICATIONS TIMELINE ANALYSIS\n")
+            append("===================================\n\n")
+            
+            # Overview
+            append("OVERVIEW\n")
+            append("--------\n")
+            append(f"Total Messages: {len(messages)}\n")
+            append(f"Date Range: {messages[0]['sent_time']} to {messages[-1]['sent_time']}\n")
+            append(f"Active Days: {len(days)}\n")
+            append("\nKey Topics:\n")
+            
+            # Identify key topics
+            for topic, count in sorted(topics.items(), key=lambda x: x[1], reverse=True)[:5]:
+                append(f"- {topic}: {count} messages\n")
+            
+            # Daily Timeline
+            append("\nDAILY TIMELINE\n")
+            append("--------------\n\n")
+            
+            for date in sorted(days.keys()):
+                day_messages = days[date]
+                participants = day_participants[date]
+                day_topics = day_topic_counts.get(date)
                 
-                for topic, count in sorted(topics.items(), key=lambda x: x[1], reverse=True)[:5]:
-                    f.write(f"- {topic}: {count} messages\n")
+                append(f"Date: {date}\n")
+                append(f"Messages: {len(day_messages)}\n")
+                append(f"Participants: {', '.join(sorted(participants))}\n")
                 
-                # Daily Timeline
-                f.write("\nDAILY TIMELINE\n")
-                f.write("--------------\n\n")
+                if day_topics:
+                    append("\nTopics Discussed:\n")
+                    for topic, count in sorted(day_topics.items(), key=lambda x: x[1], reverse=True):
+                        append(f"- {topic}: {count} messages\n")
                 
-                for date in sorted(days.keys()):
-                    day_messages = days[date]
-                    participants = set()
-                    day_topics = defaultdict(int)
-                    
-                    for msg in day_messages:
-                        participants.add(msg['from'])
-                        participants.add(msg['to'])
-                        if msg.get('subject'):
-                            day_topics[msg['subject'].replace('Re: ', '')] += 1
-                    
-                    f.write(f"Date: {date}\n")
-                    f.write(f"Messages: {len(day_messages)}\n")
-                    f.write(f"Participants: {', '.join(sorted(participants))}\n")
-                    
-                    if day_topics:
-                        f.write("\nTopics Discussed:\n")
-                        for topic, count in sorted(day_topics.items(), key=lambda x: x[1], reverse=True):
-                            f.write(f"- {topic}: {count} messages\n")
-                    
-                    f.write("\nMessage Timeline:\n")
-                    for msg in sorted(day_messages, key=lambda x: x['sent_time']):
-                        f.write(f"- {msg['sent_time']} | From: {msg['from']} to {msg['to']}\n")
-                        if msg.get('subject'):
-                            f.write(f"  Subject: {msg['subject']}\n")
-                            
-                    f.write("\n" + "-"*50 + "\n\n")
+                append("\nMessage Timeline:\n")
+                for msg in day_messages:
+                    append(f"- {msg['sent_time']} | From: {msg['from']} to {msg['to']}\n")
+                    if msg.get('subject'):
+                        append(f"  Subject: {msg['subject']}\n")
+                        
+                append("\n" + "-"*50 + "\n\n")
+            
+            atomic_write_text(output_file, ''.join(parts))
             
             return True
             
@@ -122,19 +194,20 @@ class ReportGenerator:
         output_file = self.output_dir / "communication_patterns.json"
         
         try:
+            prepare_messages(messages)
+            scan = self._scan_patterns(messages)
             patterns = {
                 'metadata': {
                     'generated_at': datetime.now().isoformat(),
                     'total_messages': len(messages)
                 },
-                'participant_patterns': self._analyze_participant_patterns(messages),
-                'topic_patterns': self._analyze_topic_patterns(messages),
-                'time_patterns': self._analyze_time_patterns(messages),
-                'response_patterns': self._analyze_response_patterns(messages)
+                'participant_patterns': self._analyze_participant_patterns(scan),
+                'topic_patterns': self._analyze_topic_patterns(scan),
+                'time_patterns': self._analyze_time_patterns(scan),
+                'response_patterns': self._analyze_response_patterns(scan)
             }
             
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(patterns, f, indent=2)
+            write_json(output_file, patterns)
             
             return True
             
@@ -142,17 +215,53 @@ class ReportGenerator:
             print(f"Error generating patterns report: {str(e)}")
             return False
             
-    def _analyze_participant_patterns(self, messages: List[Dict]) -> Dict:
-        """Analyze participant communication patterns."""
-        patterns = {}
+    def _scan_patterns(self, messages: List[Dict]) -> Dict:
+        """
+        Walk the messages once, updating the participant, topic, time and
+        response accumulators together; the _analyze_* methods then only
+        summarize them. With pandas, time and response figures are instead
+        aggregated from a frame by grouped reductions.
+        """
+        participants = {}
+        topics = defaultdict(lambda: {
+            'messages': 0,
+            'participants': set(),
+            'timeline': [],
+            # Only the mean is reported, so a running total replaces the list
+            'response_total': 0.0,
+            'response_count': 0
+        })
+        hourly = defaultdict(int)
+        daily = defaultdict(int)
+        hourly_response_totals = defaultdict(float)
+        hourly_response_counts = defaultdict(int)
+        responses = {
+            'by_participant': defaultdict(list),
+            'by_topic': defaultdict(list),
+            'by_time': defaultdict(list),
+            'overall': []
+        }
+        frame_responses = [] if pd is not None else None
+        # Bind the per-message targets to locals once, outside the loop
+        overall_responses = responses['overall']
+        participant_responses = responses['by_participant']
+        topic_responses = responses['by_topic']
+        time_responses = responses['by_time']
         
         for msg in messages:
             sender = msg['from']
             receiver = msg['to']
+            subject = msg.get('subject')
+            topic = msg['_topic'] if subject else None
+            sent = msg['_sent_dt']
+            hour = sent.hour
+            viewed = msg['_viewed_dt']
+            response_time = (viewed - sent).total_seconds() / 60 if viewed is not None else None
             
+            # Participant activity
             for participant in [sender, receiver]:
-                if participant not in patterns:
-                    patterns[participant] = {
+                if participant not in participants:
+                    participants[participant] = {
                         'sent': 0,
                         'received': 0,
                         'topics_initiated': set(),
@@ -160,26 +269,76 @@ class ReportGenerator:
                         'common_contacts': defaultdict(int),
                         'active_hours': defaultdict(int)
                     }
+            sender_stats = participants[sender]
+            receiver_stats = participants[receiver]
+            sender_stats['sent'] += 1
+            receiver_stats['received'] += 1
+            sender_stats['common_contacts'][receiver] += 1
+            if subject and not subject.startswith('Re:'):
+                sender_stats['topics_initiated'].add(subject)
+            if response_time is not None:
+                receiver_stats['response_times'].append(response_time)
+            sender_stats['active_hours'][hour] += 1
             
-            # Update counts
-            patterns[sender]['sent'] += 1
-            patterns[receiver]['received'] += 1
-            patterns[sender]['common_contacts'][receiver] += 1
-            
-            # Track topics
-            if msg.get('subject') and not msg['subject'].startswith('Re:'):
-                patterns[sender]['topics_initiated'].add(msg['subject'])
-            
-            # Track response times
-            if msg.get('first_viewed') and msg['first_viewed'] != 'Never':
-                sent = datetime.strptime(msg['sent_time'], '%m/%d/%Y at %I:%M %p')
-                viewed = datetime.strptime(msg['first_viewed'], '%m/%d/%Y at %I:%M %p')
-                response_time = (viewed - sent).total_seconds() / 60
-                patterns[receiver]['response_times'].append(response_time)
-            
-            # Track activity hours
-            sent_time = datetime.strptime(msg['sent_time'], '%m/%d/%Y at %I:%M %p')
-            patterns[sender]['active_hours'][sent_time.hour] += 1
+            # Topic activity
+            if topic is not None:
+                topic_stats = topics[topic]
+                topic_stats['messages'] += 1
+                topic_participants = topic_stats['participants']
+                topic_participants.add(sender)
+                topic_participants.add(receiver)
+                topic_stats['timeline'].append({
+                    'time': msg['sent_time'],
+                    'from': sender,
+                    'to': receiver
+                })
+                if response_time is not None:
+                    topic_stats['response_total'] += response_time
+                    topic_stats['response_count'] += 1
+            
+            if frame_responses is not None:
+                frame_responses.append(response_time)
+                continue
+            
+            # Time of day activity
+            hourly[hour] += 1
+            daily[sent.strftime('%A')] += 1
+            
+            # Response times
+            if response_time is not None:
+                hourly_response_totals[hour] += response_time
+                hourly_response_counts[hour] += 1
+                overall_responses.append(response_time)
+                participant_responses[receiver].append(response_time)
+                if topic is not None:
+                    topic_responses[topic].append(response_time)
+                time_responses[hour].append(response_time)
+        
+        frame = None
+        if frame_responses is not None:
+            # Few distinct participants and topics recur across many rows,
+            # so they are categorical: groupby then works on integer codes
+            frame = pd.DataFrame({
+                'sent': pd.DatetimeIndex([msg['_sent_dt'] for msg in messages]),
+                'receiver': pd.Categorical([msg['to'] for msg in messages]),
+                'topic': pd.Categorical([msg['_topic'] if msg.get('subject') else None for msg in messages]),
+                'response': pd.Series(frame_responses, dtype=float)
+            })
+        
+        return {
+            'frame': frame,
+            'participants': participants,
+            'topics': topics,
+            'hourly': hourly,
+            'daily': daily,
+            'hourly_response_totals': hourly_response_totals,
+            'hourly_response_counts': hourly_response_counts,
+            'responses': responses
+        }
+        
+    def _analyze_participant_patterns(self, scan: Dict) -> Dict:
+        """Analyze participant communication patterns."""
+        patterns = scan['participants']
         
         # Convert sets and calculate averages
         for p in patterns.values():
@@ -195,106 +354,51 @@ class ReportGenerator:
         
         return patterns
         
-    def _analyze_topic_patterns(self, messages: List[Dict]) -> Dict:
+    def _analyze_topic_patterns(self, scan: Dict) -> Dict:
         """Analyze topic-based communication patterns."""
-        topics = defaultdict(lambda: {
-            'messages': 0,
-            'participants': set(),
-            'timeline': [],
-            'response_times': []
-        })
-        
-        for msg in messages:
-            if msg.get('subject'):
-                topic = msg['subject'].replace('Re: ', '')
-                topics[topic]['messages'] += 1
-                topics[topic]['participants'].add(msg['from'])
-                topics[topic]['participants'].add(msg['to'])
-                topics[topic]['timeline'].append({
-                    'time': msg['sent_time'],
-                    'from': msg['from'],
-                    'to': msg['to']
-                })
-                
-                if msg.get('first_viewed') and msg['first_viewed'] != 'Never':
-                    sent = datetime.strptime(msg['sent_time'], '%m/%d/%Y at %I:%M %p')
-                    viewed = datetime.strptime(msg['first_viewed'], '%m/%d/%Y at %I:%M %p')
-                    response_time = (viewed - sent).total_seconds() / 60
-                    topics[topic]['response_times'].append(response_time)
-        
         # Convert sets and calculate averages
         patterns = {}
-        for topic, data in topics.items():
+        for topic, data in scan['topics'].items():
             patterns[topic] = {
                 'message_count': data['messages'],
                 'participants': list(data['participants']),
                 'timeline': data['timeline'],
                 'avg_response_time': (
-                    sum(data['response_times']) / len(data['response_times'])
-                    if data['response_times'] else None
+                    data['response_total'] / data['response_count']
+                    if data['response_count'] else None
                 )
             }
         
         return patterns
         
-    def _analyze_time_patterns(self, messages: List[Dict]) -> Dict:
+    def _analyze_time_patterns(self, scan: Dict) -> Dict:
         """Analyze temporal communication patterns."""
-        patterns = {
-            'hourly': defaultdict(int),
-            'daily': defaultdict(int),
-            'response_times': defaultdict(list)
-        }
-        
-        for msg in messages:
-            sent_time = datetime.strptime(msg['sent_time'], '%m/%d/%Y at %I:%M %p')
-            patterns['hourly'][sent_time.hour] += 1
-            patterns['daily'][sent_time.strftime('%A')] += 1
-            
-            if msg.get('first_viewed') and msg['first_viewed'] != 'Never':
-                viewed = datetime.strptime(msg['first_viewed'], '%m/%d/%Y at %I:%M %p')
-                response_time = (viewed - sent_time).total_seconds() / 60
-                patterns['response_times'][sent_time.hour].append(response_time)
+        if scan['frame'] is not None:
+            return self._analyze_time_frame(scan['frame'])
+            
+        response_totals = scan['hourly_response_totals']
+        response_counts = scan['hourly_response_counts']
         
         # Calculate hourly averages
         hourly_stats = {}
-        for hour, count in patterns['hourly'].items():
+        for hour, count in scan['hourly'].items():
+            responses = response_counts.get(hour)
             hourly_stats[hour] = {
                 'message_count': count,
-                'avg_response_time': (
-                    sum(patterns['response_times'][hour]) / len(patterns['response_times'][hour])
-                    if patterns['response_times'][hour] else None
-                )
+                'avg_response_time': response_totals[hour] / responses if responses else None
             }
         
         return {
             'hourly_patterns': dict(hourly_stats),
-            'daily_patterns': dict(patterns['daily'])
+            'daily_patterns': dict(scan['daily'])
         }
         
-    def _analyze_response_patterns(self, messages: List[Dict]) -> Dict:
+    def _analyze_response_patterns(self, scan: Dict) -> Dict:
         """Analyze response time patterns."""
-        patterns = {
-            'by_participant': defaultdict(list),
-            'by_topic': defaultdict(list),
-            'by_time': defaultdict(list),
-            'overall': []
-        }
-        
-        for msg in messages:
-            if msg.get('first_viewed') and msg['first_viewed'] != 'Never':
-                sent = datetime.strptime(msg['sent_time'], '%m/%d/%Y at %I:%M %p')
-                viewed = datetime.strptime(msg['first_viewed'], '%m/%d/%Y at %I:%M %p')
-                response_time = (viewed - sent).total_seconds() / 60
-                
-                patterns['overall'].append(response_time)
-                patterns['by_participant'][msg['to']].append(response_time)
-                
-                if msg.get('subject'):
-                    topic = msg['subject'].replace('Re: ', '')
-                    patterns['by_topic'][topic].append(response_time)
-                
-                hour = sent.hour
-                patterns['by_time'][hour].append(response_time)
+        if scan['frame'] is not None:
+            return self._analyze_response_frame(scan['frame'])
+            
+        patterns = scan['responses']
         
         # Calculate statistics
         stats = {
@@ -315,11 +419,67 @@ class ReportGenerator:
         
         return stats
         
+    def _analyze_time_frame(self, frame) -> Dict:
+        """Vectorized _analyze_time_patterns over the scan's frame."""
+        # sort=False keeps groups in first-seen order, as the dicts did
+        hours = frame['sent'].dt.hour
+        counts = frame.groupby(hours, sort=False).size()
+        averages = frame['response'].groupby(hours, sort=False).mean()
+        days = frame.groupby(frame['sent'].dt.day_name(), sort=False).size()
+        
+        hourly_stats = {
+            hour: {
+                'message_count': count,
+                'avg_response_time': None if math.isnan(average) else average
+            }
+            for hour, count, average in zip(counts.index.tolist(), counts.tolist(), averages.tolist())
+        }
+        
+        return {
+            'hourly_patterns': hourly_stats,
+            'daily_patterns': dict(zip(days.index.tolist(), days.tolist()))
+        }
+        
+    def _analyze_response_frame(self, frame) -> Dict:
+        """Vectorized _analyze_response_patterns over the scan's frame."""
+        answered = frame[frame['response'].notna()]
+        responses = answered['response']
+        
+        overall = None
+        if not responses.empty:
+            overall = _response_stats_row(*responses.agg(RESPONSE_AGGREGATES).tolist())
+        
+        return {
+            'overall': overall,
+            'by_participant': self._grouped_response_stats(responses, answered['receiver']),
+            'by_topic': self._grouped_response_stats(responses, answered['topic']),
+            'by_time': self._grouped_response_stats(responses, answered['sent'].dt.hour)
+        }
+        
+    def _grouped_response_stats(self, responses, keys) -> Dict:
+        """Response statistics per key, computed in one grouped aggregation."""
+        # observed=True leaves out categories with no answered messages
+        table = responses.groupby(keys, sort=False, observed=True).agg(RESPONSE_AGGREGATES)
+        return {
+            key: _response_stats_row(*row)
+            for key, row in zip(table.index.tolist(), table.values.tolist())
+        }
+        
     def _calculate_response_stats(self, times: List[float]) -> Dict:
         """Calculate response time statistics."""
         if not times:
             return None
             
+        if np is not None:
+            values = np.asarray(times, dtype=np.float64)
+            return {
+                'average': float(values.mean()),
+                'median': float(np.median(values)),
+                'min': float(values.min()),
+                'max': float(values.max()),
+                'std_dev': float(values.std(ddof=1)) if values.size > 1 else 0
+            }
+            
         return {
             'average': statistics.mean(times),
             'median': statistics.median(times),
@@ -343,8 +503,7 @@ class ReportGenerator:
                 'engagement_metrics': self._calculate_engagement(messages)
             }
             
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(summary, f, indent=2)
+            write_json(output_file, summary)
             
             return True
             
@@ -0,0 +1,67 @@
+"""
+Report Output Helpers
+--------------------
+Directory setup and file output shared by the report writers in
+report_generators and process_ofw.
+"""
+
+from contextlib import contextmanager
+from functools import lru_cache
+import json
+import os
+from pathlib import Path
+from typing import Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Working directories under a processor's base directory
+WORK_DIRS = ('input', 'output', 'ab_tools_NotebookLM', 'ab_tools_ChatGPT')
+
+@lru_cache(maxsize=None)
+def ensure_dirs(base_dir: Path) -> Tuple[Path, ...]:
+    """
+    Create the WORK_DIRS under base_dir, returning their paths. Memoized
+    per base_dir, so repeated instantiation skips the mkdir calls.
+    """
+    paths = tuple(base_dir / name for name in WORK_DIRS)
+    for path in paths:
+        path.mkdir(exist_ok=True)
+    return paths
+
+@contextmanager
+def atomic_open(path: Path, mode: str = 'w', **kwargs):
+    """
+    Open a temp file beside path and rename it over path once fully
+    written, so an interrupted run never leaves a truncated report.
+    """
+    tmp = path.with_suffix(path.suffix + '.tmp')
+    try:
+        with open(tmp, mode, **kwargs) as f:
+            yield f
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+def atomic_write_text(path: Path, text: str) -> None:
+    """Atomically replace path with text."""
+    with atomic_open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Atomically replace path with data."""
+    with atomic_open(path, 'wb') as f:
+        f.write(data)
+
+def write_json(path: Path, obj) -> None:
+    """Atomically write obj as indented JSON, using orjson when available."""
+    if orjson is not None:
+        atomic_write_bytes(path, orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        ))
+    else:
+        with atomic_open(path, 'w', encoding='utf-8') as f:
+            json.dump(obj, f, indent=2)
@@ -1,16 +1,39 @@
-from typing import Dict, Any
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Any, Iterator, Optional
 from datetime import datetime
 
+# Set by ResultFormatter.session(): the time stamped on every result formatted
+# inside it. A context variable, so sessions on different threads (or tasks)
+# each see their own.
+_session_now: ContextVar[Optional[datetime]] = ContextVar('result_now', default=None)
+
 class ResultFormatter:
     """Standardizes result formats across all pipeline components"""
     
-    @staticmethod
-    def format_analysis_result(data: Dict[str, Any], stage: str) -> Dict[str, Any]:
+    @classmethod
+    @contextmanager
+    def session(cls, now: Optional[datetime] = None) -> Iterator[datetime]:
+        """Stamp every result formatted inside the block with one timestamp"""
+        now = now or datetime.now()
+        token = _session_now.set(now)
+        try:
+            yield now
+        finally:
+            _session_now.reset(token)
+    
+    @classmethod
+    def _now(cls, now: Optional[datetime]) -> datetime:
+        return now or _session_now.get() or datetime.now()
+    
+    @classmethod
+    def format_analysis_result(cls, data: Dict[str, Any], stage: str,
+                               now: Optional[datetime] = None) -> Dict[str, Any]:
         """Format analysis results in standard structure"""
         return {
             'metadata': {
                 'stage': stage,
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': cls._now(now).isoformat(),
                 'pipeline_version': '1.0.0'
             },
             'status': 'success',
@@ -22,13 +45,14 @@ class ResultFormatter:
             }
         }
     
-    @staticmethod
-    def format_error_result(error: str, stage: str) -> Dict[str, Any]:
+    @classmethod
+    def format_error_result(cls, error: str, stage: str,
+                            now: Optional[datetime] = None) -> Dict[str, Any]:
         """Format error results in standard structure"""
         return {
             'metadata': {
                 'stage': stage,
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': cls._now(now).isoformat(),
                 'pipeline_version': '1.0.0'
             },
             'status': 'error',
@@ -40,13 +64,15 @@ class ResultFormatter:
             }
         }
     
-    @staticmethod
-    def format_session_result(results: Dict[str, Any]) -> Dict[str, Any]:
+    @classmethod
+    def format_session_result(cls, results: Dict[str, Any],
+                              now: Optional[datetime] = None) -> Dict[str, Any]:
         """Format complete session results"""
+        now = cls._now(now)
         return {
             'metadata': {
-                'session_id': datetime.now().strftime('%Y%m%d_%H%M%S'),
-                'timestamp': datetime.now().isoformat(),
+                'session_id': now.strftime('%Y%m%d_%H%M%S'),
+                'timestamp': now.isoformat(),
                 'pipeline_version': '1.0.0'
             },
             'status': 'success' if all(r.get('status') == 'success' for r in results.values()) else 'error',
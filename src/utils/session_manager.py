@@ -101,13 +101,14 @@ class SessionManager:
     def create_session(self) -> SessionState:
         """Create and initialize a new analysis session."""
         try:
-            session_id = f"SESSION_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            now = datetime.now()
+            session_id = f"SESSION_{now.strftime('%Y%m%d_%H%M%S')}"
             self.logger.info(f"Creating new session: {session_id}")
             
             input_files = self._scan_input_files()
             self.current_session = SessionState(
                 session_id=session_id,
-                created_at=datetime.now(),
+                created_at=now,
                 last_session=self._get_last_session(),
                 input_files=input_files,
                 active_stages=list(PipelineStage),
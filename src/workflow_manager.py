@@ -1,8 +1,25 @@
 from pathlib import Path
+import heapq
 import json
 import os
 from datetime import datetime
 from enum import Enum, auto
+from operator import itemgetter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _dumps_indented(obj) -> bytes:
+    """Serialize obj as 2-space indented JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+def _loads(raw: bytes):
+    """Parse UTF-8 JSON bytes, using orjson when available."""
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
 
 class DevelopmentStage(Enum):
     """Tracks both development and execution stages"""
@@ -15,6 +32,10 @@ class DevelopmentStage(Enum):
     ANALYSIS_COMPLETE = auto()
 
 class WorkflowManager:
+    # Parsed status files shared across instances, keyed by path and
+    # validated against the file's mtime and size: path -> (mtime_ns, size, status)
+    _status_cache = {}
+    
     def __init__(self, base_dir=None):
         self.base_dir = Path(base_dir) if base_dir else Path(__file__).parent.parent
         self.checkpoint_dir = self.base_dir / "output" / "checkpoints"
@@ -35,12 +56,10 @@ class WorkflowManager:
         """Load or create project status"""
         try:
             if self.status_file.exists():
-                with open(self.status_file, 'r') as f:
-                    self.status = json.load(f)
+                self.status = self._read_status()
             else:
                 self.create_initial_status()
-                with open(self.status_file, 'r') as f:
-                    self.status = json.load(f)
+                self.status = self._read_status()
                 
             # Update implementation status
             self.implementation_status = self._get_implementation_status()
@@ -49,6 +68,19 @@ class WorkflowManager:
             self.status = {}
             self.implementation_status = {'modules': {}}
     
+    def _read_status(self):
+        """Parse the status file, reusing an earlier parse while the file is unchanged."""
+        stat = self.status_file.stat()
+        key = str(self.status_file)
+        cached = self._status_cache.get(key)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+        # Read as bytes: orjson writes raw UTF-8, which the platform's
+        # default text encoding (e.g. cp1252 on Windows) would misread
+        status = _loads(self.status_file.read_bytes())
+        self._status_cache[key] = (stat.st_mtime_ns, stat.st_size, status)
+        return status
+    
     def _get_implementation_status(self):
         """Get current implementation status"""
         return {
@@ -95,8 +127,7 @@ class WorkflowManager:
         # Create src directory if it doesn't exist
         self.status_file.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(self.status_file, 'w') as f:
-            json.dump(initial_status, f, indent=2)
+        self.status_file.write_bytes(_dumps_indented(initial_status))
     
     def print_implementation_status(self):
         """Print current implementation status"""
@@ -105,12 +136,21 @@ class WorkflowManager:
             symbol = "✓" if status == "complete" else "-"
             print(f"{symbol} {module}: {status}")
             
+    def _list_checkpoints(self):
+        """List (name, mtime) for every checkpoint file in one directory scan."""
+        # scandir entries cache their stat result, so each file is stat'ed once
+        with os.scandir(self.checkpoint_dir) as entries:
+            return [
+                (entry.name, entry.stat().st_mtime) for entry in entries
+                if entry.name.startswith("checkpoint_") and entry.name.endswith(".json")
+            ]
+            
     def start_from_last_or_fresh(self):
         """Check for previous checkpoints and get user preference"""
         # Find valid checkpoints (excluding ERROR states)
         checkpoints = [
-            cp for cp in self.checkpoint_dir.glob("checkpoint_*.json")
-            if not cp.name.startswith("checkpoint_ERROR")
+            cp for cp in self._list_checkpoints()
+            if not cp[0].startswith("checkpoint_ERROR")
         ]
         
         if not checkpoints:
@@ -118,9 +158,8 @@ class WorkflowManager:
             return None
             
         try:
-            latest_checkpoint = max(checkpoints, key=lambda p: p.stat().st_mtime)
-            with open(latest_checkpoint, 'r') as f:
-                checkpoint_data = json.load(f)
+            latest_name, _ = max(checkpoints, key=itemgetter(1))
+            checkpoint_data = _loads((self.checkpoint_dir / latest_name).read_bytes())
                 
             print(f"\nFound previous successful checkpoint:")
             print(f"Stage: {checkpoint_data.get('stage', 'unknown')}")
@@ -152,8 +191,9 @@ class WorkflowManager:
             "implementation_status": self.implementation_status
         }
         
-        with open(checkpoint_file, 'w', encoding='utf-8') as f:
-            json.dump(save_data, f, indent=2)
+        # Serialize up front so the checkpoint goes out in a single write,
+        # not one write per encoder chunk
+        checkpoint_file.write_bytes(_dumps_indented(save_data))
             
         print(f"\nCheckpoint saved: {checkpoint_file.name}")
         
@@ -161,25 +201,28 @@ class WorkflowManager:
         """Save session information for Claude to read"""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
-        with open(self.session_file, 'w', encoding='utf-8') as f:
-            f.write(f"=== EvidenceAI Session Info ===\n")
-            f.write(f"Generated: {timestamp}\n\n")
-            f.write("Current Development Status:\n")
-            f.write(f"- Stage: {info.get('stage', 'Unknown')}\n")
-            f.write(f"- Focus: {info.get('focus', 'Unknown')}\n")
-            f.write("\nImplementation Status:\n")
-            for module, status in self.implementation_status.get('modules', {}).items():
-                f.write(f"- {module}: {status}\n")
-            f.write("\nProgress:\n")
-            for item in info.get('progress', []):
-                f.write(f"* {item}\n")
-            f.write("\nPending:\n")
-            for item in info.get('pending', []):
-                f.write(f"- {item}\n")
-            f.write("\nRecent Checkpoints:\n")
-            checkpoints = list(self.checkpoint_dir.glob("checkpoint_*.json"))
-            for cp in sorted(checkpoints, key=lambda p: p.stat().st_mtime, reverse=True)[:5]:
-                f.write(f"- {cp.name}\n")
+        # Build the file in memory and write it with a single call
+        parts = [
+            "=== EvidenceAI Session Info ===\n",
+            f"Generated: {timestamp}\n\n",
+            "Current Development Status:\n",
+            f"- Stage: {info.get('stage', 'Unknown')}\n",
+            f"- Focus: {info.get('focus', 'Unknown')}\n",
+            "\nImplementation Status:\n"
+        ]
+        parts.extend(
+            f"- {module}: {status}\n"
+            for module, status in self.implementation_status.get('modules', {}).items()
+        )
+        parts.append("\nProgress:\n")
+        parts.extend(f"* {item}\n" for item in info.get('progress', []))
+        parts.append("\nPending:\n")
+        parts.extend(f"- {item}\n" for item in info.get('pending', []))
+        parts.append("\nRecent Checkpoints:\n")
+        for name, _ in heapq.nlargest(5, self._list_checkpoints(), key=itemgetter(1)):
+            parts.append(f"- {name}\n")
+        
+        self.session_file.write_text(''.join(parts), encoding='utf-8')
                 
         print(f"\nSession info saved to: {self.session_file}")
 
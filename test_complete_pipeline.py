@@ -1,11 +1,31 @@
 """Test complete EvidenceAI pipeline from input to LLM outputs."""
 import os
 import json
+import re
 import shutil
 from datetime import datetime
 from pathlib import Path
 import PyPDF2
 from src.processors.output_generator import OutputGenerator
+from src.utils.ofw_time import parse_ofw_timestamp
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Header line opening each message in an OFW export
+_MESSAGE_MARKER = re.compile(r'Message \d+ of \d+')
+
+def _message_blocks(content):
+    """Yield the text after each "Message X of Y" marker, up to the next one."""
+    start = None
+    for marker in _MESSAGE_MARKER.finditer(content):
+        if start is not None:
+            yield content[start:marker.start()]
+        start = marker.end()
+    if start is not None:
+        yield content[start:]
 
 class PipelineTester:
     def __init__(self):
@@ -116,10 +136,10 @@ class PipelineTester:
     def _parse_messages(self, content):
         """Parse individual messages from content."""
         messages = []
-        # Split on "Message X of Y" pattern
-        blocks = content.split("Message")[1:]  # Skip header
-        
-        for block in blocks:
+        # Walk the "Message X of Y" blocks lazily; the text before the first
+        # marker is the report header. Matching the full marker, not the bare
+        # word, keeps a body that mentions "Message" in one piece.
+        for block in _message_blocks(content):
             try:
                 lines = block.strip().split('\n')
                 message = {}
@@ -149,9 +169,9 @@ class PipelineTester:
                 # Add ISO timestamp
                 if 'sent_time' in message:
                     try:
-                        dt = datetime.strptime(message['sent_time'], '%m/%d/%Y at %I:%M %p')
-                        message['timestamp'] = dt.isoformat()
-                    except:
+                        # Same result as strptime with OFW's '%m/%d/%Y at %I:%M %p' format
+                        message['timestamp'] = parse_ofw_timestamp(message['sent_time']).isoformat()
+                    except ValueError:
                         message['timestamp'] = None
                 
                 if message.get('sent_time'):  # Only add if we have at least a timestamp
@@ -170,8 +190,17 @@ class PipelineTester:
         # Save JSON data
         self.output_dir.mkdir(exist_ok=True)
         json_path = self.output_dir / f"{filename}_raw.json"
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(content, f, indent=2)
+        dumps = orjson.dumps if orjson is not None else (lambda obj: json.dumps(obj).encode('utf-8'))
+        
+        # Write the envelope by hand and serialize one message at a time, one
+        # per line, so no encoding of the whole message list is held in memory
+        with open(json_path, 'wb', buffering=1 << 16) as f:
+            f.write(b'{"metadata": ' + dumps(content['metadata']) + b',\n"messages": [\n')
+            for i, message in enumerate(content['messages']):
+                if i:
+                    f.write(b',\n')
+                f.write(dumps(message))
+            f.write(b'\n]}\n')
         
         print(f"✓ Raw data saved: {json_path.name}")
 
@@ -1,4 +1,5 @@
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 import json
 from datetime import datetime, timedelta
@@ -15,31 +16,41 @@ class TestNotebookLMGenerator:
 
     def setup_directories(self):
         """Ensure all required directories exist"""
-        for directory in [self.input_dir, self.output_dir, self.notebooklm_dir]:
-            directory.mkdir(parents=True, exist_ok=True)
-            
-        # Create subdirectories for different document types
-        for subdir in ['threads', 'topics', 'participants']:
-            (self.notebooklm_dir / subdir).mkdir(exist_ok=True)
+        directories = [self.input_dir, self.output_dir, self.notebooklm_dir]
+        
+        # Subdirectories for different document types
+        directories.extend(self.notebooklm_dir / subdir for subdir in ['threads', 'topics', 'participants'])
+        
+        # Parents sort ahead of children, so each mkdir is a single syscall;
+        # only a missing ancestor outside the list needs the parents=True walk
+        for directory in sorted(directories, key=lambda d: len(d.parts)):
+            try:
+                directory.mkdir(exist_ok=True)
+            except FileNotFoundError:
+                directory.mkdir(parents=True, exist_ok=True)
 
     def generate_test_documents(self):
         """Generate test NotebookLM documents"""
         self.setup_directories()
         
-        # Generate main documents
-        self._generate_overview()
-        self._generate_timeline()
-        self._generate_relationships()
-        self._generate_index()
-        
-        # Generate thread documents
-        self._generate_thread_documents()
-        
-        # Generate topic documents
-        self._generate_topic_documents()
-        
-        # Generate participant documents
-        self._generate_participant_documents()
+        # Every document is an independent file, so the writes can overlap
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            # Generate main documents
+            futures = [executor.submit(generate) for generate in (
+                self._generate_overview,
+                self._generate_timeline,
+                self._generate_relationships,
+                self._generate_index
+            )]
+            
+            # Generate thread, topic and participant documents
+            futures.extend(self._generate_thread_documents(executor))
+            futures.extend(self._generate_topic_documents(executor))
+            futures.extend(self._generate_participant_documents(executor))
+            
+            # Surface any write errors
+            for future in as_completed(futures):
+                future.result()
 
     def _generate_overview(self):
         """Generate overview document"""
@@ -96,8 +107,7 @@ class TestNotebookLMGenerator:
 - [Thread Analysis](threads/index.md)
 """
         
-        with open(self.notebooklm_dir / "00_Overview.md", 'w', encoding='utf-8') as f:
-            f.write(overview)
+        (self.notebooklm_dir / "00_Overview.md").write_bytes(overview.encode('utf-8'))
 
     def _generate_timeline(self):
         """Generate timeline document"""
@@ -150,8 +160,7 @@ class TestNotebookLMGenerator:
 {self._generate_key_events()}
 """
         
-        with open(self.notebooklm_dir / "timeline.md", 'w', encoding='utf-8') as f:
-            f.write(timeline)
+        (self.notebooklm_dir / "timeline.md").write_bytes(timeline.encode('utf-8'))
 
     def _generate_relationships(self):
         """Generate relationships document"""
@@ -222,11 +231,10 @@ class TestNotebookLMGenerator:
    - Financial tracking
 """
         
-        with open(self.notebooklm_dir / "relationships.md", 'w', encoding='utf-8') as f:
-            f.write(relationships)
+        (self.notebooklm_dir / "relationships.md").write_bytes(relationships.encode('utf-8'))
 
-    def _generate_thread_documents(self):
-        """Generate thread-specific documents"""
+    def _generate_thread_documents(self, executor):
+        """Submit thread-specific documents for writing"""
         threads = [
             {
                 "id": "financial",
@@ -245,9 +253,11 @@ class TestNotebookLMGenerator:
             }
         ]
         
-        for thread in threads:
-            with open(self.notebooklm_dir / "threads" / f"{thread['id']}.md", 'w', encoding='utf-8') as f:
-                f.write(thread['content'])
+        return [executor.submit(self._write_thread, thread) for thread in threads]
+
+    def _write_thread(self, thread):
+        """Write a single thread document"""
+        (self.notebooklm_dir / "threads" / f"{thread['id']}.md").write_bytes(thread['content'].encode('utf-8'))
 
     def _generate_financial_thread(self):
         return """# Financial Discussions Thread
@@ -355,8 +365,8 @@ class TestNotebookLMGenerator:
 - Holiday planning
 """
 
-    def _generate_topic_documents(self):
-        """Generate topic-specific documents"""
+    def _generate_topic_documents(self, executor):
+        """Submit topic-specific documents for writing"""
         topics = [
             {
                 "id": "financial",
@@ -370,9 +380,11 @@ class TestNotebookLMGenerator:
             }
         ]
         
-        for topic in topics:
-            with open(self.notebooklm_dir / "topics" / f"{topic['id']}.md", 'w', encoding='utf-8') as f:
-                f.write(topic['content'])
+        return [executor.submit(self._write_topic, topic) for topic in topics]
+
+    def _write_topic(self, topic):
+        """Write a single topic document"""
+        (self.notebooklm_dir / "topics" / f"{topic['id']}.md").write_bytes(topic['content'].encode('utf-8'))
 
     def _generate_financial_topic(self):
         return """# Topic Analysis: Financial Coordination
@@ -443,8 +455,8 @@ class TestNotebookLMGenerator:
 - Documentation
 """
 
-    def _generate_participant_documents(self):
-        """Generate participant-specific documents"""
+    def _generate_participant_documents(self, executor):
+        """Submit participant-specific documents for writing"""
         participants = [
             {
                 "id": "robert",
@@ -458,9 +470,11 @@ class TestNotebookLMGenerator:
             }
         ]
         
-        for participant in participants:
-            with open(self.notebooklm_dir / "participants" / f"{participant['id']}.md", 'w', encoding='utf-8') as f:
-                f.write(participant['content'])
+        return [executor.submit(self._write_participant, participant) for participant in participants]
+
+    def _write_participant(self, participant):
+        """Write a single participant document"""
+        (self.notebooklm_dir / "participants" / f"{participant['id']}.md").write_bytes(participant['content'].encode('utf-8'))
 
     def _generate_robert_profile(self):
         return """# Participant Analysis: Robert Moyer
@@ -543,8 +557,7 @@ class TestNotebookLMGenerator:
 - Use document names for reference searches
 """
         
-        with open(self.notebooklm_dir / "index.md", 'w', encoding='utf-8') as f:
-            f.write(index)
+        (self.notebooklm_dir / "index.md").write_bytes(index.encode('utf-8'))
 
     def _generate_key_events(self):
         """Generate key events timeline"""
@@ -0,0 +1,44 @@
+import pytest
+import json
+import sys
+import os
+
+# Add parent directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.checkpoint_registry import CheckpointRegistry
+
+def read_log(base_dir):
+    with open(base_dir / 'checkpoints.log', 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+class TestCheckpointRegistry:
+    def test_reused_status_dict_is_snapshotted(self, tmp_path):
+        """Mutating a status dict after passing it does not rewrite or drop checkpoints"""
+        registry = CheckpointRegistry(tmp_path)
+        status = {'message_count': 1}
+        
+        registry.update_stage('parse', status)
+        status['message_count'] = 2
+        registry.update_stage('parse', status)
+        status['message_count'] = 3
+        registry.update_stage('parse', status)
+        registry.close()
+        
+        counts = [cp['status']['message_count'] for cp in read_log(tmp_path)]
+        assert counts == [1, 2, 3]
+        
+        saved = json.loads((tmp_path / 'checkpoint_registry.json').read_text(encoding='utf-8'))
+        assert saved['pipeline_status']['messages_processed'] == 3
+    
+    def test_repeated_status_is_a_heartbeat(self, tmp_path):
+        """An update repeating the last stage and status is not logged again"""
+        registry = CheckpointRegistry(tmp_path)
+        status = {'message_count': 1}
+        
+        registry.update_stage('parse', status)
+        registry.update_stage('parse', dict(status))
+        registry.update_stage('parse', status)
+        registry.close()
+        
+        assert len(read_log(tmp_path)) == 1
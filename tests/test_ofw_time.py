@@ -0,0 +1,66 @@
+import pytest
+from datetime import datetime
+import itertools
+import sys
+import os
+
+# Add parent directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.ofw_time import TIME_FORMAT, parse_ofw_timestamp
+
+def strptime_or_none(value):
+    try:
+        return datetime.strptime(value, TIME_FORMAT)
+    except ValueError:
+        return None
+
+def parse_or_none(value):
+    try:
+        return parse_ofw_timestamp(value)
+    except ValueError:
+        return None
+
+class TestParseOFWTimestamp:
+    @pytest.mark.parametrize("value,expected", [
+        ("01/02/2024 at 3:04 PM", datetime(2024, 1, 2, 15, 4)),
+        ("1/2/2024 at 3:04 pm", datetime(2024, 1, 2, 15, 4)),
+        ("12/25/2024 at 12:05 AM", datetime(2024, 12, 25, 0, 5)),
+        ("12/25/2024 at 12:05 PM", datetime(2024, 12, 25, 12, 5)),
+        ("01/02/2024 at  3:04 PM", datetime(2024, 1, 2, 15, 4)),
+        ("01/02/2024 at 3:04\tPM", datetime(2024, 1, 2, 15, 4)),
+    ])
+    def test_parses_valid_timestamps(self, value, expected):
+        assert parse_ofw_timestamp(value) == expected
+    
+    @pytest.mark.parametrize("value", [
+        " 01/02/2024 at 3:04 PM",
+        "01/02/2024 at 3:04 PM ",
+        "01/02/24 at 3:04 PM",
+        "13/02/2024 at 3:04 PM",
+        "02/30/2024 at 3:04 PM",
+        "01/02/2024 at 0:04 PM",
+        "01/02/2024 at 3:60 PM",
+        "01/02/2024 3:04 PM",
+        "Never",
+        "",
+    ])
+    def test_rejects_malformed_timestamps(self, value):
+        with pytest.raises(ValueError):
+            parse_ofw_timestamp(value)
+    
+    def test_matches_strptime(self):
+        """Every combination of field variants parses as strptime does"""
+        months = ["1", "01", "12", "13", "0", " 1"]
+        days = ["2", "02", " 2", "29", "31", "32", "0"]
+        years = ["2024", "2023", "24", "02024"]
+        spaces = [" ", "  ", "\t", ""]
+        hours = ["3", "03", "12", "0", "13"]
+        minutes = ["4", "04", "59", "60"]
+        meridiems = ["AM", "pm", "XM"]
+        
+        for month, day, year, space, hour, minute, meridiem in itertools.product(
+            months, days, years, spaces, hours, minutes, meridiems
+        ):
+            value = f"{month}/{day}/{year}{space}at {hour}:{minute}{space}{meridiem}"
+            assert parse_or_none(value) == strptime_or_none(value), value